@@ -10,6 +10,7 @@ DATE_FORMAT = "%Y/%m/%d %H:%M:%S %Z"
 APACHE_MAILING_LIST_BASE_URL: str = "https://lists.apache.org/api/mbox.lua"
 MAIL_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S %z"
 MAIL_DATE_FORMAT_ZONE = "%a, %d %b %Y %H:%M:%S %z (%Z)"
+VOTE_TYPES: tuple[str, ...] = ("+1", "0", "-1")
 
 
 class IPState(StrEnum):
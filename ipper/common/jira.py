@@ -1,8 +1,14 @@
+import logging
+from collections.abc import Iterable
 from enum import StrEnum
+from functools import lru_cache
 
 from jira import JIRA, JIRAError
 
 APACHE_JIRA_URL = "https://issues.apache.org/jira"
+JIRA_SEARCH_CHUNK_SIZE = 100
+
+logger = logging.getLogger(__name__)
 
 
 class JiraStatus(StrEnum):
@@ -25,13 +31,61 @@ class JiraStatus(StrEnum):
                 return option
 
 
+@lru_cache(maxsize=1)
+def get_apache_jira_client() -> JIRA:
+    """Returns a client for the Apache JIRA, shared across lookups."""
+
+    return JIRA(APACHE_JIRA_URL)
+
+
+@lru_cache(maxsize=4096)
 def get_apache_jira_status(issue_id: str) -> JiraStatus:
+    """Returns the status of the given Apache JIRA issue.
 
-    apache_jira = JIRA(APACHE_JIRA_URL)
+    Results are cached per issue ID, so repeated lookups within a run do not
+    make another request to the JIRA server.
+    """
 
     try:
-        issue = apache_jira.issue(issue_id, fields="status")
+        issue = get_apache_jira_client().issue(issue_id, fields="status")
     except JIRAError:
         return JiraStatus.UNKNOWN
 
     return JiraStatus.getStatus(issue.fields.status.name)
+
+
+def get_apache_jira_statuses(
+    issue_ids: Iterable[str], chunk: int = JIRA_SEARCH_CHUNK_SIZE
+) -> dict[str, JiraStatus]:
+    """Returns the statuses of the given Apache JIRA issues.
+
+    Issues are fetched with a single JQL search per chunk of issue IDs rather
+    than one request per issue. Any issue the search does not return (for
+    example one that has since been moved to a new key) falls back to an
+    individual lookup.
+    """
+
+    unique_ids: list[str] = sorted(set(issue_ids))
+    statuses: dict[str, JiraStatus] = {}
+
+    for start in range(0, len(unique_ids), chunk):
+        id_chunk = unique_ids[start : start + chunk]
+        try:
+            issues = get_apache_jira_client().search_issues(
+                f"issueKey in ({', '.join(id_chunk)})",
+                maxResults=len(id_chunk),
+                validate_query=False,
+                fields="status",
+            )
+        except JIRAError as err:
+            logger.warning("Bulk JIRA status search failed: %s", err)
+            continue
+
+        for issue in issues:
+            statuses[issue.key] = JiraStatus.getStatus(issue.fields.status.name)
+
+    for issue_id in unique_ids:
+        if issue_id not in statuses:
+            statuses[issue_id] = get_apache_jira_status(issue_id)
+
+    return statuses
@@ -12,13 +12,23 @@ import logging
 import re
 from dataclasses import dataclass, field
 from email.utils import parseaddr
+from functools import lru_cache
 from pathlib import Path
 
 import requests
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 logger = logging.getLogger(__name__)
 
+# Format: uid   [optional trust] Name (optional comment) <email@domain.com>
+KEYS_UID_PATTERN: re.Pattern = re.compile(r"^uid\s+(.+?)\s*<([^>]+)>", re.MULTILINE)
+# Each key block starts with a "pub" line
+KEYS_BLOCK_SPLIT_PATTERN: re.Pattern = re.compile(r"(?=^pub\s)", re.MULTILINE)
+# [ultimate], [full], etc. trust indicators
+KEYS_TRUST_PATTERN: re.Pattern = re.compile(r"\[[^\]]*\]")
+# (comments) after the name
+KEYS_COMMENT_PATTERN: re.Pattern = re.compile(r"\([^)]*\)")
+
 
 @dataclass
 class CommitterInfo:
@@ -37,6 +47,18 @@ class CommitterInfo:
         self.emails = [email.lower().strip() for email in self.emails]
 
 
+def _sort_name_tokens(name: str) -> str:
+    """Sorts the words of a name, as the token sort ratio does before scoring.
+
+    Args:
+        name: Normalized name
+
+    Returns:
+        The words of the name sorted and joined by single spaces
+    """
+    return " ".join(sorted(name.split()))
+
+
 @dataclass
 class CommitterIndex:
     """Index of committers for a project with matching capabilities."""
@@ -47,14 +69,32 @@ class CommitterIndex:
     _email_to_committer: dict[str, CommitterInfo] = field(
         default_factory=dict, init=False
     )
+    _normalized_names: list[str] = field(default_factory=list, init=False)
+    _sorted_name_to_committer: dict[str, CommitterInfo] = field(
+        default_factory=dict, init=False
+    )
 
     def __post_init__(self):
-        """Build email lookup dictionary for O(1) exact matching."""
+        """Build email and name lookup dictionaries for O(1) exact matching, and
+        the normalized names used for fuzzy matching."""
         self._email_to_committer = {}
         for committer in self.committers:
             for email in committer.emails:
                 self._email_to_committer[email.lower().strip()] = committer
 
+        self._normalized_names = [
+            committer.name.lower().strip() for committer in self.committers
+        ]
+
+        # Keep the first committer for each name, as the fuzzy match would
+        self._sorted_name_to_committer = {}
+        for committer, normalized_name in zip(
+            self.committers, self._normalized_names, strict=True
+        ):
+            sorted_name = _sort_name_tokens(normalized_name)
+            if sorted_name:
+                self._sorted_name_to_committer.setdefault(sorted_name, committer)
+
     def match_email_exact(self, email: str) -> CommitterInfo | None:
         """Match email address exactly (case-insensitive).
 
@@ -85,21 +125,26 @@ class CommitterIndex:
             return None, 0.0
 
         normalized_name = name.lower().strip()
-        best_match: CommitterInfo | None = None
-        best_score = 0.0
 
-        for committer in self.committers:
-            # Try token sort ratio (handles word order variations)
-            score = fuzz.token_sort_ratio(
-                normalized_name, committer.name.lower().strip()
-            )
+        # Most senders spell their name as in the KEYS file, which the token
+        # sort ratio would score 100, so look those up directly
+        exact_match = self._sorted_name_to_committer.get(
+            _sort_name_tokens(normalized_name)
+        )
+        if exact_match:
+            return exact_match, 100.0
 
-            if score > best_score:
-                best_score = score
-                best_match = committer
+        # Token sort ratio handles word order variations. extractOne scores all
+        # the names in one call and returns the first of the best scoring ones.
+        best = process.extractOne(
+            normalized_name, self._normalized_names, scorer=fuzz.token_sort_ratio
+        )
+        if best is None:
+            return None, 0.0
 
+        _, best_score, best_index = best
         if best_score >= threshold:
-            return best_match, best_score
+            return self.committers[best_index], best_score
         return None, best_score
 
     def is_committer(
@@ -134,9 +179,12 @@ class CommitterIndex:
         return False, 0.0, "none"
 
 
+@lru_cache(maxsize=4096)
 def parse_email_from_header(from_header: str) -> tuple[str, str]:
     """Parse name and email from email 'From' header.
 
+    The same senders appear on many messages, so parsed headers are cached.
+
     Handles common formats:
     - "John Doe" <john@example.com>
     - john@example.com (John Doe)
@@ -198,19 +246,15 @@ def parse_keys_file(keys_content: str) -> list[CommitterInfo]:
     # Dictionary to aggregate committers by name: {name: {emails: set, raw_uid: str}}
     committer_data: dict[str, dict[str, any]] = {}
 
-    # Pattern to match uid lines with name and email
-    # Format: uid   [optional trust] Name (optional comment) <email@domain.com>
-    uid_pattern = re.compile(r"^uid\s+(.+?)\s*<([^>]+)>", re.MULTILINE)
-
     # Split into key blocks (each starting with "pub")
-    blocks = re.split(r"(?=^pub\s)", keys_content, flags=re.MULTILINE)
+    blocks = KEYS_BLOCK_SPLIT_PATTERN.split(keys_content)
 
     for block in blocks:
         if not block.strip():
             continue
 
         # Extract all uid lines for this key (may have multiple)
-        uid_matches = uid_pattern.findall(block)
+        uid_matches = KEYS_UID_PATTERN.findall(block)
         if not uid_matches:
             continue
 
@@ -221,8 +265,8 @@ def parse_keys_file(keys_content: str) -> list[CommitterInfo]:
         # 1. Remove [ultimate], [full], etc. trust indicators in square brackets
         # 2. Remove (comments) in parentheses
         # 3. Strip whitespace
-        name = re.sub(r"\[[^\]]*\]", "", primary_name_raw)  # Remove [...]
-        name = re.sub(r"\([^)]*\)", "", name)  # Remove (...)
+        name = KEYS_TRUST_PATTERN.sub("", primary_name_raw)  # Remove [...]
+        name = KEYS_COMMENT_PATTERN.sub("", name)  # Remove (...)
         name = name.strip()
 
         if not name:
@@ -238,7 +282,7 @@ def parse_keys_file(keys_content: str) -> list[CommitterInfo]:
             # Keep the first raw_uid we encountered
         else:
             # First time seeing this committer - store their data
-            raw_uid_clean = re.sub(r"\[[^\]]*\]", "", primary_name_raw).strip()
+            raw_uid_clean = KEYS_TRUST_PATTERN.sub("", primary_name_raw).strip()
             raw_uid = f"{raw_uid_clean} <{primary_email.strip()}>"
 
             committer_data[name] = {
@@ -8,35 +8,98 @@ to track improvement proposal mentions and votes.
 import datetime as dt
 import json
 import logging
+import mmap
+import os
 import re
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from email import message_from_bytes
 from email.message import Message
-from mailbox import mbox
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
+import numpy as np
 import requests
-from pandas import DataFrame, concat, read_csv, to_datetime
+from pandas import (
+    DataFrame,
+    DatetimeTZDtype,
+    Series,
+    concat,
+    read_csv,
+    to_datetime,
+    to_numeric,
+)
 from rapidfuzz import fuzz
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ipper.common.constants import VOTE_TYPES
 from ipper.common.keys import CommitterIndex, parse_email_from_header
 from ipper.common.utils import generate_month_list
 
 logger = logging.getLogger(__name__)
 
 APACHE_MAILING_LIST_BASE_URL: str = "https://lists.apache.org/api/mbox.lua"
-MAIL_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S %z"
-MAIL_DATE_FORMAT_ZONE = "%a, %d %b %Y %H:%M:%S %z (%Z)"
+MBOX_DOWNLOAD_WORKERS: int = 8
+MBOX_DOWNLOAD_BLOCK_SIZE: int = 1024 * 1024
 PARENTS_PATTERN = re.compile(r"\(([^)]+)\)")
 VOTE_PATTERN = re.compile(r"(?<!\d)(?<!\.)([\+\-]1|0)(?!\d)", re.IGNORECASE)
 URL_PATTERN = re.compile(r"https?://\S+")
+# Content transfer encodings which hide the text of a message body (base64,
+# quoted-printable and the uuencode variants)
+ENCODED_BODY_MARKERS: tuple[bytes, ...] = (b"base64", b"quoted-printable", b"uue")
+# Column types of processed mentions. The proposal ID column (e.g. "kip") is int64.
+MENTION_COLUMN_DTYPES: dict[str, str] = {
+    "mention_type": "object",
+    "message_id": "int64",
+    "mbox_year": "int64",
+    "mbox_month": "int64",
+    "timestamp": "datetime64[ns, UTC]",
+    "from": "object",
+    "vote": "object",
+}
 TALLY_PATTERN = re.compile(
     r"\b([2-9]|\d{2,})\s+(?:binding\s+)?(?:[\+\-]1|0)(?!\d)",
     re.IGNORECASE,
 )
 
 
+@lru_cache(maxsize=1)
+def _get_mbox_session() -> requests.Session:
+    """Returns the shared HTTP session used for mbox downloads.
+
+    The session keeps connections to the archive server alive between downloads,
+    and its connection pool is large enough for each download worker thread.
+
+    Returns:
+        Session with retries configured
+    """
+
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=MBOX_DOWNLOAD_WORKERS,
+        pool_maxsize=MBOX_DOWNLOAD_WORKERS,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
 def get_monthly_mbox_file(
     mailing_list: str,
     domain: str,
@@ -86,22 +149,19 @@ def get_monthly_mbox_file(
         "d": f"{year}-{month}",
     }
 
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=3,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-    )
-    session.mount("https://", HTTPAdapter(max_retries=retry_strategy))
-    session.mount("http://", HTTPAdapter(max_retries=retry_strategy))
-
-    with session.get(
+    with _get_mbox_session().get(
         APACHE_MAILING_LIST_BASE_URL, params=options, stream=True, timeout=timeout
     ) as response:
         response.raise_for_status()
-        with open(filepath, "wb") as mbox_file:
-            for chunk in response.iter_content(chunk_size=8192):
-                mbox_file.write(chunk)
+        # Write the body in large blocks rather than many small Python chunks
+        try:
+            with open(filepath, "wb") as mbox_file:
+                for chunk in response.iter_content(chunk_size=MBOX_DOWNLOAD_BLOCK_SIZE):
+                    mbox_file.write(chunk)
+        except requests.RequestException:
+            # Don't leave a truncated archive to be skipped as already downloaded
+            filepath.unlink(missing_ok=True)
+            raise
 
     return filepath
 
@@ -160,17 +220,30 @@ def get_multiple_mbox(
     latest_year = 0
     latest_month = 0
 
-    for year, month in month_list:
-        logger.info("Downloading %s archive for %s/%s", mailing_list, month, year)
-        try:
-            filepath = get_monthly_mbox_file(
-                mailing_list,
-                domain,
-                year,
-                month,
-                output_directory=output_directory,
-                overwrite=overwrite,
+    # The downloads are network bound, so fetch several months at once
+    with ThreadPoolExecutor(max_workers=MBOX_DOWNLOAD_WORKERS) as executor:
+        downloads: list[tuple[int, int, Future[Path]]] = []
+        for year, month in month_list:
+            logger.info("Downloading %s archive for %s/%s", mailing_list, month, year)
+            downloads.append(
+                (
+                    year,
+                    month,
+                    executor.submit(
+                        get_monthly_mbox_file,
+                        mailing_list,
+                        domain,
+                        year,
+                        month,
+                        output_directory=output_directory,
+                        overwrite=overwrite,
+                    ),
+                )
             )
+
+    for year, month, download in downloads:
+        try:
+            filepath = download.result()
         except requests.RequestException as ex:
             logger.error(
                 "Downloading %s archive for %s/%s: %s", mailing_list, month, year, ex
@@ -285,28 +358,15 @@ def parse_message_timestamp(date_str: str) -> dt.datetime | None:
         Parsed datetime object or None if parsing fails
     """
 
-    timestamp: dt.datetime | None = None
-
     try:
-        timestamp = dt.datetime.strptime(date_str, MAIL_DATE_FORMAT)
-    except ValueError:
-        pass
-    else:
-        return timestamp
-
-    try:
-        timestamp = dt.datetime.strptime(date_str, MAIL_DATE_FORMAT_ZONE)
-    except ValueError:
-        pass
-    else:
-        return timestamp
-
-    # If neither the main format or one with TZ string work, try stripping
-    # the TZ String as one last hail Mary.
-    try:
-        timestamp = dt.datetime.strptime(date_str.split(" (")[0], MAIL_DATE_FORMAT)
-    except ValueError:
+        timestamp: dt.datetime = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
         logger.warning("Could not parse timestamp: %s", date_str)
+        return None
+
+    # A "-0000" (unknown) or missing zone gives a naive time, which is in UTC
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=dt.UTC)
 
     return timestamp
 
@@ -327,15 +387,16 @@ def extract_message_payload(msg: Message) -> list[str]:
         if part.is_multipart():
             continue
 
-        raw_bytes = part.get_payload(decode=True)
-        if raw_bytes is None:
-            continue
-
         # Skip HTML parts since they often contain the same text as the plain text part
-        # but with HTML tags, which can interfere with regex matching.
+        # but with HTML tags, which can interfere with regex matching. This is checked
+        # before the part is decoded, so the HTML is never decoded only to be dropped.
         if part.get_content_type() == "text/html":
             continue
 
+        raw_bytes = part.get_payload(decode=True)
+        if raw_bytes is None:
+            continue
+
         charset = part.get_content_charset() or "utf-8"
         try:
             payload: str = raw_bytes.decode(charset)
@@ -370,7 +431,9 @@ def _extract_parenthetical_text(line: str) -> list[str]:
     Returns:
         List of strings found within parentheses (without the parentheses)
     """
-    matches = PARENTS_PATTERN.findall(line)
+    # No match can end after the last ")", and stopping there saves every "("
+    # after it scanning to the end of the line, which is quadratic
+    matches = PARENTS_PATTERN.findall(line, 0, line.rfind(")") + 1)
     return [match.strip() for match in matches]
 
 
@@ -449,8 +512,13 @@ def _check_line_for_binding_marker(line: str, vote_position: int) -> str | None:
     # This helps avoid matching words that appear before the vote
     line_after_vote = line[vote_position:]
 
-    # Remove any parenthetical content (already handled separately)
-    line_no_parens = PARENTS_PATTERN.sub("", line_after_vote)
+    # Remove any parenthetical content (already handled separately). As when
+    # extracting it, only the text up to the last ")" can contain a match.
+    parens_end = line_after_vote.rfind(")") + 1
+    line_no_parens = (
+        PARENTS_PATTERN.sub("", line_after_vote[:parens_end])
+        + line_after_vote[parens_end:]
+    )
 
     # Split into words and check only the first few words after the vote
     # This prevents matching "binding" that's far from the vote (e.g., "binding contract")
@@ -536,20 +604,11 @@ def parse_for_vote(
         Vote string ("+1", "0", "-1") or None if no binding vote found
     """
 
-    # First pass: Look for explicit binding/non-binding votes
-    for line in payload.split("\n"):
-        # Skip quoted lines
-        if line.lstrip().startswith(">"):
-            continue
-
-        # Strip URLs to avoid false vote matches from hex in URLs
-        line_no_urls = URL_PATTERN.sub("", line)
-
-        # Check if line contains a vote
-        vote_match = VOTE_PATTERN.search(line_no_urls)
-        if not vote_match:
-            continue
+    # Every pass only looks at the lines containing a vote, so find them once
+    vote_lines: list[tuple[str, re.Match]] = _find_vote_lines(payload)
 
+    # First pass: Look for explicit binding/non-binding votes
+    for line_no_urls, vote_match in vote_lines:
         vote = vote_match.group(1)
 
         # Extract any parenthetical text from the line
@@ -604,10 +663,7 @@ def parse_for_vote(
             # (e.g., "no 0 and no -1 votes"), which would be misdetected as
             # actual votes. If 2+ distinct types appear, skip the email.
             distinct_vote_types: set[str] = set()
-            for line in payload.split("\n"):
-                if line.lstrip().startswith(">"):
-                    continue
-                line_no_urls = URL_PATTERN.sub("", line)
+            for line_no_urls, _ in vote_lines:
                 for m in VOTE_PATTERN.finditer(line_no_urls):
                     distinct_vote_types.add(_normalize_vote(m.group(1)))
             if len(distinct_vote_types) >= 2:
@@ -624,10 +680,9 @@ def parse_for_vote(
             # Tally count detection: skip emails containing patterns like
             # "3 binding +1" or "5 +1" which indicate a summary/tally rather
             # than an actual vote. Only counts >= 2 trigger this.
-            for line in payload.split("\n"):
-                if line.lstrip().startswith(">"):
-                    continue
-                if TALLY_PATTERN.search(URL_PATTERN.sub("", line)):
+            # A tally count always precedes a vote, so only vote lines can match
+            for line_no_urls, _ in vote_lines:
+                if TALLY_PATTERN.search(line_no_urls):
                     logger.debug(
                         "  Skipping tally/summary email from committer: %s <%s> "
                         "(found tally count pattern)",
@@ -642,14 +697,7 @@ def parse_for_vote(
             # reliably detected without an explicit binding marker. Real zero
             # votes are extremely rare and will still be counted if they include
             # an explicit marker like "0 (binding)" (handled by the first pass).
-            for line in payload.split("\n"):
-                if line.lstrip().startswith(">"):
-                    continue
-
-                vote_match = VOTE_PATTERN.search(URL_PATTERN.sub("", line))
-                if not vote_match:
-                    continue
-
+            for _, vote_match in vote_lines:
                 vote = vote_match.group(1)
                 if vote == "0":
                     continue
@@ -667,6 +715,40 @@ def parse_for_vote(
     return None
 
 
+def _find_vote_lines(payload: str) -> list[tuple[str, re.Match]]:
+    """Finds the lines of the payload which contain a vote.
+
+    Quoted lines (starting with ">") are skipped and URLs are stripped from each
+    line, to avoid false vote matches from hex in URLs.
+
+    Args:
+        payload: Email message body text
+
+    Returns:
+        List of each vote line, with URLs removed, and its first vote match
+    """
+
+    vote_lines: list[tuple[str, re.Match]] = []
+    for line in payload.split("\n"):
+        if line.lstrip().startswith(">"):
+            continue
+
+        # A vote needs a 1 or a 0, and these substring checks are far cheaper
+        # than a failed search of the line
+        if "1" not in line and "0" not in line:
+            continue
+
+        # Most lines have no URL, so skip the substitution for them
+        if "http" in line:
+            line = URL_PATTERN.sub("", line)
+
+        vote_match: re.Match | None = VOTE_PATTERN.search(line)
+        if vote_match:
+            vote_lines.append((line, vote_match))
+
+    return vote_lines
+
+
 def _normalize_vote(vote: str) -> str:
     """Normalize vote string to standard format.
 
@@ -685,6 +767,94 @@ def _normalize_vote(vote: str) -> str:
     return vote
 
 
+def iter_mbox_message_bytes(filepath: Path) -> Iterator[bytes]:
+    """Reads the raw bytes of each message of an mbox archive one at a time.
+
+    Unlike mailbox.mbox, this does not build a table of contents for the whole
+    archive and then seek back to each message. Instead the file is memory mapped
+    and scanned once for the "From " lines that split messages, in the same way
+    mailbox.mbox does.
+    The "From " line is not part of the message, and a blank line before the
+    next "From " line is not part of the message it follows.
+
+    Args:
+        filepath: Path to the mbox file
+
+    Returns:
+        Iterator of the raw bytes of each message, in archive order
+    """
+
+    with open(filepath, "rb") as mbox_file:
+        if os.fstat(mbox_file.fileno()).st_size == 0:
+            return
+
+        # Map the archive rather than reading it line by line, so the message
+        # boundaries can be found with fast substring searches
+        with mmap.mmap(mbox_file.fileno(), 0, access=mmap.ACCESS_READ) as archive:
+            size: int = len(archive)
+            from_line: int = (
+                0 if archive[:5] == b"From " else _next_from_line(archive, 0)
+            )
+
+            while from_line != -1:
+                message_start: int = archive.find(b"\n", from_line) + 1 or size
+                next_from_line: int = _next_from_line(archive, message_start - 1)
+                message_end: int = size if next_from_line == -1 else next_from_line
+
+                message_bytes: bytes = archive[message_start:message_end]
+                # The blank line separating messages belongs to the archive, not
+                # the message
+                if message_bytes == b"\n" or message_bytes.endswith(b"\n\n"):
+                    message_bytes = message_bytes[:-1]
+
+                yield message_bytes
+                from_line = next_from_line
+
+
+def _next_from_line(archive: mmap.mmap, position: int) -> int:
+    # The offset of the next line starting with "From " after position, or -1
+    newline: int = archive.find(b"\nFrom ", position)
+    return -1 if newline == -1 else newline + 1
+
+
+def iter_mbox_messages(filepath: Path) -> Iterator[Message]:
+    """Reads the messages of an mbox archive one at a time.
+
+    Args:
+        filepath: Path to the mbox file
+
+    Returns:
+        Iterator of the parsed messages, in archive order
+    """
+
+    for message_bytes in iter_mbox_message_bytes(filepath):
+        yield message_from_bytes(message_bytes)
+
+
+def _may_mention(message_bytes: bytes, mention_prefix: bytes) -> bool:
+    """Checks whether a raw message could contain a mention, without parsing it.
+
+    Args:
+        message_bytes: Raw bytes of the message
+        mention_prefix: Lower case bytes which every mention contains (e.g. b"kip-")
+
+    Returns:
+        False only if the message's subject and body cannot contain a mention
+    """
+
+    # Non-ASCII text may match the pattern when ignoring case without containing
+    # the prefix, so it is always parsed
+    if not message_bytes.isascii():
+        return True
+
+    lowered: bytes = message_bytes.lower()
+    if mention_prefix in lowered:
+        return True
+
+    # Encoded bodies only show their text once decoded
+    return any(encoding in lowered for encoding in ENCODED_BODY_MARKERS)
+
+
 def process_mbox_archive(
     filepath: Path,
     pattern: re.Pattern,
@@ -693,6 +863,7 @@ def process_mbox_archive(
     vote_keyword: str = "VOTE",
     discuss_keyword: str = "DISCUSS",
     committer_index: CommitterIndex | None = None,
+    mention_prefix: str | None = None,
 ) -> DataFrame:
     """Process the supplied mbox archive, harvest improvement proposal mentions.
 
@@ -704,65 +875,88 @@ def process_mbox_archive(
         vote_keyword: Keyword in subject line indicating a vote thread
         discuss_keyword: Keyword in subject line indicating a discussion thread
         committer_index: Optional index of committers for automatic binding vote detection
+        mention_prefix: Optional lower case text which every match of the pattern
+            contains (e.g. 'kip-'). Messages and bodies without it are not parsed or
+            searched with the pattern, which is much slower than the substring check.
 
     Returns:
         DataFrame containing each mention with metadata
     """
 
-    mail_box: mbox = mbox(filepath)
-
     year_month: list[str] = filepath.name.split(".")[0].split("-")
     mbox_year: int = int(year_month[-2])
     mbox_month: int = int(year_month[-1])
 
-    data: list[dict[str, str | int | dt.datetime | None]] = []
+    # The mentions are collected column by column, so the DataFrame can be built
+    # directly from them without pandas inferring the columns row by row.
+    proposal_ids: list[int] = []
+    mention_types: list[str] = []
+    message_ids: list[int] = []
+    timestamps: list[dt.datetime] = []
+    from_headers: list[str] = []
+    votes: list[str | None] = []
+    # The mentions already added for the current message. A message can repeat a
+    # mention (e.g. the same proposal twice in its body), and as the rest of a
+    # mention's row is fixed by the message, these are the only duplicate rows.
+    message_mentions: set[tuple[int, str, str | None]] = set()
+
+    def add_mention(
+        proposal_id: int,
+        mention_type: str,
+        message_id: int,
+        timestamp: dt.datetime,
+        from_header: str,
+        vote: str | None = None,
+    ) -> None:
+        mention: tuple[int, str, str | None] = (proposal_id, mention_type, vote)
+        if mention in message_mentions:
+            return
+        message_mentions.add(mention)
+
+        proposal_ids.append(proposal_id)
+        mention_types.append(mention_type)
+        message_ids.append(message_id)
+        timestamps.append(timestamp)
+        from_headers.append(from_header)
+        votes.append(vote)
+
     vote_thread_starters: dict[int, str] = {}
 
-    for key, msg in mail_box.items():
-        subject_match: re.Match | None = re.search(pattern, msg["subject"])
+    prefix_bytes: bytes | None = mention_prefix.encode() if mention_prefix else None
+
+    for key, message_bytes in enumerate(iter_mbox_message_bytes(filepath)):
+        # A message which cannot mention a proposal adds no rows, so is not parsed
+        if prefix_bytes and not _may_mention(message_bytes, prefix_bytes):
+            continue
+
+        msg: Message = message_from_bytes(message_bytes)
+        message_mentions.clear()
 
         timestamp: dt.datetime | None = parse_message_timestamp(msg["Date"])
         if not timestamp:
             logger.warning("Could not parse timestamp for message %s", key)
             continue
 
+        # Header lookups search the message's headers each time, so fetch once
+        subject: str = msg["subject"] or ""
+        subject_match: re.Match | None = pattern.search(subject)
         is_vote: bool = False
-        from_header: str = str(msg["from"])
+        # Most senders post many messages, so share one string per sender across
+        # the mention rows rather than holding a copy for each message
+        from_header: str = sys.intern(str(msg["from"]))
 
         if subject_match:
             # Extract the ID from the first capturing group
             subject_id: int = int(subject_match.group(1))
-            data.append(
-                {
-                    id_column_name: subject_id,
-                    "mention_type": "subject",
-                    "message_id": key,
-                    "mbox_year": mbox_year,
-                    "mbox_month": mbox_month,
-                    "timestamp": timestamp,
-                    "from": from_header,
-                    "vote": None,
-                }
-            )
+            add_mention(subject_id, "subject", key, timestamp, from_header)
 
-            if vote_keyword in msg["subject"]:
+            if vote_keyword in subject:
                 is_vote = True
                 if subject_id not in vote_thread_starters:
                     vote_thread_starters[subject_id] = from_header
 
-            elif discuss_keyword in msg["subject"]:
-                data.append(
-                    {
-                        id_column_name: subject_id,
-                        "mention_type": "discuss",
-                        "message_id": key,
-                        "mbox_year": mbox_year,
-                        "mbox_month": mbox_month,
-                        "timestamp": timestamp,
-                        "from": from_header,
-                        "vote": None,
-                    }
-                )
+            elif discuss_keyword in subject:
+                add_mention(subject_id, "discuss", key, timestamp, from_header)
 
         try:
             valid_payloads: list[str] = extract_message_payload(msg)
@@ -784,21 +978,19 @@ def process_mbox_archive(
                 vote_str: str | None = parse_for_vote(
                     payload, from_header, committer_index, is_starter
                 )
-                data.append(
-                    {
-                        id_column_name: subject_id,
-                        "mention_type": "vote",
-                        "message_id": key,
-                        "mbox_year": mbox_year,
-                        "mbox_month": mbox_month,
-                        "timestamp": timestamp,
-                        "from": from_header,
-                        "vote": vote_str,
-                    }
-                )
+                add_mention(subject_id, "vote", key, timestamp, from_header, vote_str)
+
+            # Most messages do not mention any proposal. Non-ASCII text is always
+            # searched, as some characters only match the pattern ignoring case.
+            if (
+                mention_prefix
+                and payload.isascii()
+                and mention_prefix not in payload.lower()
+            ):
+                continue
 
             try:
-                body_matches: list[str] = re.findall(pattern, payload)
+                body_matches: list[str] = pattern.findall(payload)
             except TypeError:
                 logger.error("Unable to parse payload of type %s", type(payload))
                 continue
@@ -806,81 +998,284 @@ def process_mbox_archive(
             if body_matches:
                 for body_id_str in body_matches:
                     body_id: int = int(body_id_str)
-                    data.append(
-                        {
-                            id_column_name: body_id,
-                            "mention_type": "body",
-                            "message_id": key,
-                            "mbox_year": mbox_year,
-                            "mbox_month": mbox_month,
-                            "timestamp": timestamp,
-                            "from": from_header,
-                            "vote": None,
-                        }
-                    )
+                    add_mention(body_id, "body", key, timestamp, from_header)
+
+    mention_count: int = len(proposal_ids)
+    output = DataFrame(
+        {
+            id_column_name: Series(proposal_ids, dtype="int64"),
+            "mention_type": Series(mention_types, dtype="object"),
+            "message_id": Series(message_ids, dtype="int64"),
+            "mbox_year": np.full(mention_count, mbox_year, dtype="int64"),
+            "mbox_month": np.full(mention_count, mbox_month, dtype="int64"),
+            "timestamp": to_datetime(Series(timestamps, dtype="object"), utc=True),
+            "from": Series(from_headers, dtype="object"),
+            "vote": Series(votes, dtype="object"),
+        },
+        columns=mention_columns,
+    )
 
-    output = DataFrame(data, columns=mention_columns)
-    output["timestamp"] = to_datetime(output["timestamp"], utc=True)
+    return output
 
-    return output.drop_duplicates()
 
+def create_empty_mentions(mention_columns: list[str]) -> DataFrame:
+    """Creates an empty mentions DataFrame with the column types of processed mentions.
 
-def vote_converter(vote: str | None) -> str | None:
-    """Converter function for the vote column of the mbox cache dataframe.
+    Using typed (rather than all object) columns means that combining the empty
+    frame with processed mentions does not upcast the result to object columns.
 
     Args:
-        vote: Vote value as string or None
+        mention_columns: List of column names for the DataFrame
 
     Returns:
-        Normalized vote string or None
+        Empty DataFrame with typed columns
     """
 
-    if vote != "":
-        try:
-            vote_num: float = float(cast(str, vote))
-        except (ValueError, TypeError):
-            logger.warning("Could not convert vote value to float: %r", vote)
-            return None
+    return DataFrame(
+        {
+            column: Series(dtype=MENTION_COLUMN_DTYPES.get(column, "int64"))
+            for column in mention_columns
+        }
+    )
 
-        if vote_num >= 1.0:
-            return "+1"
 
-        if vote_num <= -1.0:
-            return "-1"
+def combine_mentions(
+    file_mentions: list[DataFrame], mention_columns: list[str]
+) -> DataFrame:
+    """Combines the mentions processed from several mbox files into one DataFrame.
 
-        return "0"
+    The frames from process_mbox_archive share the same typed columns, so they are
+    concatenated in a single pass. A single frame is returned as is, rather than
+    being copied.
 
-    return None
+    Args:
+        file_mentions: List of DataFrames of mentions, as returned by
+            process_mbox_archive
+        mention_columns: List of column names for the DataFrame
+
+    Returns:
+        DataFrame containing all the mentions, with a fresh index
+    """
+
+    if not file_mentions:
+        return create_empty_mentions(mention_columns)
+
+    if len(file_mentions) == 1:
+        return file_mentions[0]
+
+    return concat(file_mentions, ignore_index=True)
+
+
+def normalise_votes(votes: Series) -> Series:
+    """Normalises the vote column of the mbox cache dataframe.
+
+    Args:
+        votes: Series of vote values as loaded from the cache (strings or missing)
 
+    Returns:
+        Series of normalised vote strings ("+1", "-1" or "0"), or None where there
+        is no vote or the value is not a number
+    """
+
+    vote_nums: Series = to_numeric(votes, errors="coerce")
+
+    invalid_count: int = int((votes.notna() & vote_nums.isna()).sum())
+    if invalid_count:
+        logger.warning("Could not convert %s vote value(s) to float", invalid_count)
 
-def load_mbox_cache_file(cache_file: Path) -> DataFrame:
+    normalised = np.full(len(votes), None, dtype=object)
+    normalised[vote_nums.notna().to_numpy()] = "0"
+    normalised[(vote_nums >= 1.0).to_numpy()] = "+1"
+    normalised[(vote_nums <= -1.0).to_numpy()] = "-1"
+
+    return Series(normalised, index=votes.index, name=votes.name)
+
+
+def load_mbox_cache_file(
+    cache_file: Path, usecols: list[str] | None = None
+) -> DataFrame:
     """Loads the pre-processed mbox cache file and applies the relevant type converters.
 
     Args:
         cache_file: Path to the CSV cache file
+        usecols: Optional subset of columns to load. Loading only the columns
+            a caller needs avoids parsing the rest of the (large) cache file.
 
     Returns:
         DataFrame with parsed data
     """
 
+    # The timestamp and vote columns are handled separately below
+    dtypes: dict[str, str] = {
+        column: dtype
+        for column, dtype in MENTION_COLUMN_DTYPES.items()
+        if column not in ("timestamp", "vote")
+    }
+
     file_data: DataFrame = read_csv(
-        cache_file, converters={"vote": vote_converter}, parse_dates=["timestamp"]
+        cache_file, usecols=usecols, dtype=dtypes | {"vote": "object"}
     )
 
+    if "vote" in file_data.columns:
+        file_data["vote"] = normalise_votes(file_data["vote"])
+
+    # Parsing the timestamps as ISO 8601 after loading is much quicker than
+    # read_csv's parse_dates, which has to infer the format.
+    if "timestamp" in file_data.columns:
+        file_data["timestamp"] = to_datetime(
+            file_data["timestamp"], format="ISO8601", utc=True
+        )
+
     return file_data
 
 
+def process_mbox_files(
+    mbox_files: list[Path],
+    process_func: Callable[[Path], DataFrame],
+    max_workers: int | None = None,
+) -> tuple[list[DataFrame], list[str]]:
+    """Process the supplied mbox files, in parallel worker processes where there
+    is more than one file.
+
+    Args:
+        mbox_files: List of mbox files to process
+        process_func: Function to process individual mbox files. This must be
+            picklable (a module level function or a partial of one).
+        max_workers: Maximum number of worker processes (defaults to the CPU
+            count). A value of 1 processes the files in the current process.
+
+    Returns:
+        Tuple of (list of DataFrames in the same order as the supplied files,
+        list of error messages for failed files)
+    """
+
+    results: dict[Path, DataFrame] = {}
+    errors: list[str] = []
+
+    if max_workers == 1 or len(mbox_files) <= 1:
+        for mbox_file in mbox_files:
+            logger.info("Processing %s", mbox_file.name)
+            try:
+                results[mbox_file] = process_func(mbox_file)
+            except Exception as ex:
+                logger.error("Processing file %s: %s", mbox_file.name, ex)
+                errors.append(f"ERROR processing file {mbox_file.name}: {ex}")
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(process_func, mbox_file): mbox_file
+                for mbox_file in mbox_files
+            }
+            for future in as_completed(futures):
+                mbox_file = futures[future]
+                try:
+                    results[mbox_file] = future.result()
+                    logger.info("Processed %s", mbox_file.name)
+                except Exception as ex:
+                    logger.error("Processing file %s: %s", mbox_file.name, ex)
+                    errors.append(f"ERROR processing file {mbox_file.name}: {ex}")
+
+    return [results[f] for f in mbox_files if f in results], errors
+
+
+def save_mbox_cache_file(mentions: DataFrame, cache_file: Path) -> None:
+    """Saves the processed mentions to the mbox cache file.
+
+    Formatting the timestamps dominates the cost of writing the cache, as pandas
+    formats datetimes one at a time. UTC timestamps with whole second precision
+    (as parsed from mail headers) are instead formatted in one vectorised numpy
+    call, giving the same output that pandas would write.
+
+    Args:
+        mentions: DataFrame containing the mentions to save
+        cache_file: Path to the CSV cache file
+    """
+
+    output: DataFrame = mentions
+    timestamps = mentions["timestamp"]
+
+    if isinstance(timestamps.dtype, DatetimeTZDtype) and str(timestamps.dt.tz) == "UTC":
+        values = timestamps.dt.tz_localize(None).to_numpy().astype("datetime64[ns]")
+        missing = np.isnat(values)
+        whole_seconds = not (values[~missing].astype("int64") % 1_000_000_000).any()
+        if whole_seconds:
+            formatted = np.char.add(
+                np.char.replace(np.datetime_as_string(values, unit="s"), "T", " "),
+                "+00:00",
+            ).astype(object)
+            formatted[missing] = None
+            output = mentions.assign(timestamp=formatted)
+
+    # Write a temporary sibling file and swap it into place, so a crash mid-write
+    # leaves the previous cache intact rather than truncated
+    tmp_cache_file: str = f"{cache_file}.tmp"
+    output.to_csv(tmp_cache_file, index=False)
+    os.replace(tmp_cache_file, cache_file)
+
+
+def merge_mentions(
+    existing_mentions: DataFrame, new_mentions: list[DataFrame]
+) -> DataFrame:
+    """Merge newly processed mentions into the existing mentions.
+
+    Only the months covered by the new mentions are compared, so the full mention
+    history is not de-duplicated. Within those months a cached mention repeated by
+    the new mentions is dropped. The message_id is a message's position within its
+    mbox download, which can change when a month is downloaded again, so it is
+    left out of the comparison. Cached mentions from another list's archive of the
+    same month, such as user alongside dev, are not repeated and so are kept.
+
+    Args:
+        existing_mentions: DataFrame of the previously cached mentions
+        new_mentions: List of DataFrames from newly processed mbox files
+
+    Returns:
+        DataFrame containing the merged mentions
+    """
+
+    new_frames: list[DataFrame] = [
+        file_mentions for file_mentions in new_mentions if not file_mentions.empty
+    ]
+    if not new_frames:
+        return existing_mentions
+
+    new_mention_data: DataFrame = concat(new_frames, ignore_index=True)
+
+    reprocessed_months = set(
+        new_mention_data["mbox_year"] * 100 + new_mention_data["mbox_month"]
+    )
+    existing_months = (
+        existing_mentions["mbox_year"] * 100 + existing_mentions["mbox_month"]
+    )
+    in_reprocessed_month = existing_months.isin(reprocessed_months)
+
+    # The new mentions come first, so a repeated mention keeps its current id
+    month_mentions: DataFrame = concat(
+        (new_mention_data, existing_mentions[in_reprocessed_month]), ignore_index=True
+    ).drop_duplicates(
+        subset=[column for column in new_mention_data.columns if column != "message_id"]
+    )
+
+    return concat(
+        (existing_mentions[~in_reprocessed_month], month_mentions), ignore_index=True
+    )
+
+
 def process_all_mbox_in_directory(
     directory: Path,
-    process_func,
+    process_func: Callable[[Path], DataFrame],
     mention_columns: list[str],
+    max_workers: int | None = None,
 ) -> tuple[DataFrame, list[str]]:
     """Process all mbox files in a directory and return combined DataFrame.
 
     Args:
         directory: Directory containing mbox files
-        process_func: Function to process individual mbox files
+        process_func: Function to process individual mbox files. This must be
+            picklable (a module level function or a partial of one).
         mention_columns: List of column names for the resulting DataFrame
+        max_workers: Maximum number of worker processes (defaults to the CPU
+            count). A value of 1 processes the files in the current process.
 
     Returns:
         Tuple of (DataFrame containing all mentions, list of error messages for failed files)
@@ -889,28 +1284,36 @@ def process_all_mbox_in_directory(
     mbox_files: list[Path] = sorted(directory.glob("*.mbox"))
 
     logger.info("Found %s mbox files to process", len(mbox_files))
-    all_mentions: DataFrame = DataFrame(columns=mention_columns)
-    errors: list[str] = []
-
-    for mbox_file in mbox_files:
-        logger.info("Processing %s", mbox_file.name)
-        try:
-            file_data = process_func(mbox_file)
-            all_mentions = concat((all_mentions, file_data), ignore_index=True)
-        except Exception as ex:
-            error_msg = f"ERROR processing file {mbox_file.name}: {ex}"
-            logger.error("Processing file %s: %s", mbox_file.name, ex)
-            errors.append(error_msg)
+    file_mentions, errors = process_mbox_files(mbox_files, process_func, max_workers)
 
     if errors:
         logger.warning("%s of %s files failed to process", len(errors), len(mbox_files))
 
-    # Deduplicate before returning
-    all_mentions = all_mentions.drop_duplicates()
+    all_mentions: DataFrame = drop_duplicate_mentions(
+        combine_mentions(file_mentions, mention_columns)
+    )
 
     return all_mentions, errors
 
 
+def drop_duplicate_mentions(mentions: DataFrame) -> DataFrame:
+    """Drops repeated mention rows from mentions combined from several mbox files.
+
+    Each file's mentions are already unique. Files covering the same month can
+    still repeat rows. The message_id is only a message's position within its own
+    mbox file, so the dev and user archives of one month share ids, and whole rows
+    are compared.
+
+    Args:
+        mentions: DataFrame containing the combined mentions
+
+    Returns:
+        DataFrame with the first of each repeated mention kept
+    """
+
+    return mentions.drop_duplicates()
+
+
 def create_vote_dict(
     mentions: DataFrame,
     id_column: str,
@@ -921,37 +1324,89 @@ def create_vote_dict(
     vote types (+1, 0, -1), so a voter only appears under their most
     recent vote.
     """
-    vote_dict: dict[int, dict[str, list[dict[str, str]]]] = {}
-    for proposal_id, proposal_votes in mentions[~mentions["vote"].isna()][
-        [id_column, "from", "vote", "timestamp"]
-    ].groupby(id_column):
-        # First pass: determine each voter's latest vote across all types
-        latest_votes: dict[str, dict] = {}
-        for _, row in proposal_votes.iterrows():
-            voter_name = row["from"].replace('"', "")
-            timestamp = row["timestamp"]
-            if (
-                voter_name not in latest_votes
-                or timestamp > latest_votes[voter_name]["raw_timestamp"]
-            ):
-                latest_votes[voter_name] = {
-                    "name": voter_name,
-                    "vote": row["vote"],
-                    "timestamp": timestamp.strftime("%b %d, %Y %H:%M UTC"),
-                    "raw_timestamp": timestamp,
-                }
-
-        # Second pass: group by vote type
-        proposal_dict = {}
-        for vote in ["+1", "0", "-1"]:
-            voters = [v for v in latest_votes.values() if v["vote"] == vote]
-            sorted_voters = sorted(
-                voters, key=lambda x: x["raw_timestamp"], reverse=True
-            )
-            proposal_dict[vote] = [
-                {"name": v["name"], "timestamp": v["timestamp"]} for v in sorted_voters
-            ]
+    votes: DataFrame = mentions.loc[
+        mentions["vote"].notna(), [id_column, "from", "vote", "timestamp"]
+    ]
+    votes = votes.assign(name=votes["from"].str.replace('"', "", regex=False))
+    # Voters with the same latest vote time are listed in the order they first
+    # voted on the proposal
+    votes["first_seen"] = votes.groupby([id_column, "name"], sort=False).ngroup()
+
+    # Each voter's latest vote across all types (the first one if tied)
+    latest_votes: DataFrame = (
+        votes.sort_values("timestamp", ascending=False, kind="stable")
+        .drop_duplicates(subset=[id_column, "name"], keep="first")
+        .sort_values(
+            [id_column, "timestamp", "first_seen"],
+            ascending=[True, False, True],
+            kind="stable",
+        )
+    )
+    latest_votes["formatted"] = latest_votes["timestamp"].dt.strftime(
+        "%b %d, %Y %H:%M UTC"
+    )
 
-        vote_dict[cast(int, proposal_id)] = proposal_dict
+    vote_dict: dict[int, dict[str, list[dict[str, str]]]] = {}
+    for proposal_id, vote, name, formatted in zip(
+        latest_votes[id_column].tolist(),
+        latest_votes["vote"].tolist(),
+        latest_votes["name"].tolist(),
+        latest_votes["formatted"].tolist(),
+        strict=True,
+    ):
+        proposal_dict = vote_dict.get(proposal_id)
+        if proposal_dict is None:
+            proposal_dict = {vote_type: [] for vote_type in VOTE_TYPES}
+            vote_dict[cast(int, proposal_id)] = proposal_dict
+
+        if vote in proposal_dict:
+            proposal_dict[vote].append({"name": name, "timestamp": formatted})
 
     return vote_dict
+
+
+def get_most_recent_mentions(mentions: DataFrame, id_column: str) -> DataFrame:
+    """Gets the most recent mention, for each mention type, for each proposal.
+
+    Args:
+        mentions: DataFrame containing proposal mentions
+        id_column: Name of the proposal ID column (e.g., "kip" or "flip")
+
+    Returns:
+        DataFrame with only the most recent mention of each type for each proposal
+    """
+
+    # Sorting by timestamp (missing timestamps first) and keeping the last row of
+    # each group selects the latest mention in one vectorised pass
+    return (
+        mentions.sort_values("timestamp", kind="stable", na_position="first")
+        .drop_duplicates(subset=[id_column, "mention_type"], keep="last")
+        .reset_index(drop=True)
+    )
+
+
+def get_most_recent_mention_by_type(mentions: DataFrame, id_column: str) -> DataFrame:
+    """Gets a dataframe indexed by proposal ID with the most recent mention of each
+    mention type, plus an "overall" column with the most recent mention of any type.
+
+    Args:
+        mentions: DataFrame containing proposal mentions
+        id_column: Name of the proposal ID column (e.g., "kip" or "flip")
+
+    Returns:
+        DataFrame with proposal IDs as index and mention types as columns
+    """
+
+    most_recent_mentions: DataFrame = get_most_recent_mentions(mentions, id_column)
+
+    # There is only one mention per proposal and type, so the mentions can be
+    # reshaped directly rather than aggregated with a pivot table. Like a pivot
+    # table, mentions without a timestamp are left out.
+    most_recent: DataFrame = (
+        most_recent_mentions.dropna(subset=["timestamp"])
+        .set_index([id_column, "mention_type"])["timestamp"]
+        .unstack("mention_type")
+    )
+    most_recent["overall"] = most_recent.max(axis=1, skipna=True, numeric_only=False)
+
+    return most_recent
@@ -1,40 +1,94 @@
 import datetime as dt
+import os
+from functools import lru_cache
+from pathlib import Path
 
 from dateutil.relativedelta import relativedelta
+from jinja2 import Environment, FileSystemLoader, Template
+
+from ipper.common.constants import DATE_FORMAT
+
+
+def current_date_string(date_format: str = DATE_FORMAT) -> str:
+    """Returns the current UTC time as a formatted string."""
+    return dt.datetime.now(dt.UTC).strftime(date_format)
+
+
+def write_text_atomic(filepath: str | Path, text: str) -> None:
+    """Writes text to a file by way of a temporary sibling file.
+
+    The temporary file is swapped into place with os.replace, so readers never
+    see a partially written file and a crash mid-write leaves the previous
+    version intact.
+    """
+    tmp_filepath = f"{filepath}.tmp"
+    with open(tmp_filepath, "w", encoding="utf8") as tmp_file:
+        tmp_file.write(text)
+    os.replace(tmp_filepath, filepath)
+
+
+@lru_cache(maxsize=4)
+def _template_environment(template_dir: str) -> Environment:
+    return Environment(loader=FileSystemLoader(template_dir))
+
+
+def get_template(template_dir: str, template_filename: str) -> Template:
+    """Gets the named template from the supplied template directory.
+
+    One Jinja environment is shared per template directory, so each template is
+    loaded and compiled once per run, however many pages are rendered with it.
+    """
+    template_path = Path(template_dir).joinpath(Path(template_filename))
+    if not template_path.exists():
+        raise AttributeError(f"Template {template_path} not found")
+
+    return _template_environment(template_dir).get_template(template_filename)
 
 
 def generate_month_list(now: dt.datetime, then: dt.datetime) -> list[tuple[int, int]]:
     """Generates a list of year-month strings spanning from then to now"""
 
-    month_list: list[tuple[int, int]] = []
-
-    year: int = then.year
-    month: int = then.month
-    finished: bool = False
+    # Count months from year zero so the range is plain integer arithmetic.
+    # The starting month is always included, even if it is after now.
+    start: int = then.year * 12 + then.month - 1
+    end: int = max(now.year * 12 + now.month - 1, start)
 
-    while not finished:
-        month_list.append((year, month))
+    return [(month // 12, month % 12 + 1) for month in range(start, end + 1)]
 
-        # Check if we've reached or passed the current month/year
-        if year > now.year or (year == now.year and month >= now.month):
-            finished = True
-        else:
-            # Move to next month
-            month = (month + 1) % 13
-            if month == 0:
-                year += 1
-                month = 1
 
-    return month_list
+def calculate_age(
+    date_str: str, date_format: str, now: dt.datetime | None = None
+) -> str:
+    """Calculate the age string for the given date string
 
+    Args:
+        date_str: The UTC date string to give the age of
+        date_format: The strptime format of the date string
+        now: The datetime to measure the age at, defaults to the current time
 
-def calculate_age(date_str: str, date_format: str) -> str:
-    """Calculate the age string for the given date string"""
+    Returns:
+        Human readable age string, e.g. "1 year, 2 months and 3 weeks"
+    """
 
     then: dt.datetime = dt.datetime.strptime(date_str, date_format).replace(
         tzinfo=dt.UTC
     )
-    now: dt.datetime = dt.datetime.now(dt.UTC)
+    return format_age(then, now)
+
+
+def format_age(then: dt.datetime, now: dt.datetime | None = None) -> str:
+    """Format the age of an already parsed, timezone aware datetime.
+
+    Args:
+        then: The datetime to give the age of
+        now: The datetime to measure the age at, defaults to the current time.
+            Pass this in when formatting many ages so they share one reference.
+
+    Returns:
+        Human readable age string, e.g. "1 year, 2 months and 3 weeks"
+    """
+    if now is None:
+        now = dt.datetime.now(dt.UTC)
 
     # Get timedelta for day count
     diff: dt.timedelta = now - then
@@ -1,4 +1,5 @@
 from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import requests
@@ -6,6 +7,7 @@ import requests
 APACHE_CONFLUENCE_BASE_URL: str = "https://wiki.apache.org/confluence"
 APACHE_CONFLUENCE_DATE_FORMAT: str = "%Y-%m-%dT%H:%M:%S.000Z"
 CONTENT_URL: str = APACHE_CONFLUENCE_BASE_URL + "/rest/api/content"
+WIKI_DOWNLOAD_WORKERS: int = 4
 
 
 def get_wiki_page_info(
@@ -56,43 +58,79 @@ def get_wiki_page_body(wiki_page_info: dict[str, Any], timeout: int = 30) -> str
 
 
 def child_page_generator(
-    wiki_page_info, chunk: int, timeout: int
+    wiki_page_info, chunk: int, timeout: int, workers: int = WIKI_DOWNLOAD_WORKERS
 ) -> Generator[dict, None, None]:
     """Generator function which will yield the child info dict of each child page of the
-    supplied wiki page"""
+    supplied wiki page.
 
-    wiki_page_child_info_request: requests.Response = requests.get(
-        APACHE_CONFLUENCE_BASE_URL + wiki_page_info["_expandable"]["children"],
-        timeout=timeout,
-    )
+    After the first page of results, the following pages are requested several at a
+    time by their offset, rather than one after another via each page's next link.
+    The child pages are still yielded in order."""
+
+    # Reuse one connection pool for all the paginated requests
+    with requests.Session() as session:
+        wiki_page_child_info_request: requests.Response = session.get(
+            APACHE_CONFLUENCE_BASE_URL + wiki_page_info["_expandable"]["children"],
+            timeout=timeout,
+        )
+
+        wiki_page_child_info_request.raise_for_status()
+
+        child_page_url: str = (
+            APACHE_CONFLUENCE_BASE_URL
+            + wiki_page_child_info_request.json()["_expandable"]["page"]
+        )
+
+        response_json = _get_child_page(session, child_page_url, chunk, 0, timeout)
+        yield from response_json["results"]
+
+        if "next" not in response_json["_links"]:
+            return
 
-    wiki_page_child_info_request.raise_for_status()
+        # The server can return fewer results per page than were asked for, so step
+        # through the offsets by the page size it actually used
+        page_size: int = response_json.get("limit") or len(response_json["results"])
+        start: int = response_json.get("start", 0) + page_size
 
-    first_child_request: requests.Response = requests.get(
-        APACHE_CONFLUENCE_BASE_URL
-        + wiki_page_child_info_request.json()["_expandable"]["page"],
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                pages: list[Future[dict[str, Any]]] = [
+                    executor.submit(
+                        _get_child_page,
+                        session,
+                        child_page_url,
+                        chunk,
+                        start + page * page_size,
+                        timeout,
+                    )
+                    for page in range(workers)
+                ]
+
+                for page_future in pages:
+                    response_json = page_future.result()
+                    yield from response_json["results"]
+
+                    if "next" not in response_json["_links"]:
+                        return
+
+                start += workers * page_size
+
+
+def _get_child_page(
+    session: requests.Session, child_page_url: str, chunk: int, start: int, timeout: int
+) -> dict[str, Any]:
+    """Gets the page of child page results starting at the supplied offset"""
+
+    child_request: requests.Response = session.get(
+        child_page_url,
         params={
             "limit": str(chunk),
+            "start": str(start),
             "expand": "history.lastUpdated,body.view",
         },
         timeout=timeout,
     )
 
-    first_child_request.raise_for_status()
-
-    response_json = first_child_request.json()
-    more_results: bool = True
-
-    while more_results:
-        yield from response_json["results"]
+    child_request.raise_for_status()
 
-        if "next" in response_json["_links"]:
-            kip_child_response: requests.Response = requests.get(
-                APACHE_CONFLUENCE_BASE_URL + response_json["_links"]["next"],
-                timeout=timeout,
-            )
-            kip_child_response.raise_for_status()
-            response_json = kip_child_response.json()
-            more_results = True
-        else:
-            more_results = False
+    return child_request.json()
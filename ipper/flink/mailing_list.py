@@ -6,19 +6,30 @@ mbox archives from Apache Flink mailing lists to track FLIP mentions and votes.
 
 import logging
 import re
+from functools import partial
 from pathlib import Path
 
-from pandas import DataFrame, concat
+from pandas import DataFrame
 
-from ipper.common.keys import get_committer_index
+from ipper.common.keys import CommitterIndex, get_committer_index
+from ipper.common.mailing_list import (
+    create_empty_mentions,
+    load_mbox_cache_file,
+    merge_mentions,
+    process_mbox_files,
+    save_mbox_cache_file,
+)
 from ipper.common.mailing_list import (
     get_monthly_mbox_file as generic_get_monthly_mbox_file,
 )
 from ipper.common.mailing_list import (
-    get_multiple_mbox as generic_get_multiple_mbox,
+    get_most_recent_mention_by_type as generic_get_most_recent_mention_by_type,
 )
 from ipper.common.mailing_list import (
-    load_mbox_cache_file,
+    get_most_recent_mentions as generic_get_most_recent_mentions,
+)
+from ipper.common.mailing_list import (
+    get_multiple_mbox as generic_get_multiple_mbox,
 )
 from ipper.common.mailing_list import (
     process_mbox_archive as generic_process_mbox_archive,
@@ -110,21 +121,26 @@ def get_multiple_mbox(
     )
 
 
-def process_mbox_archive(filepath: Path) -> DataFrame:
+def process_mbox_archive(
+    filepath: Path, committer_index: CommitterIndex | None = None
+) -> DataFrame:
     """Process the supplied mbox archive, harvest the FLIP data and
     create a DataFrame containing each mention.
 
     Args:
         filepath: Path to the mbox file
+        committer_index: Optional pre-loaded committer index. If not supplied
+            the cached Flink committer index is loaded.
 
     Returns:
         DataFrame containing each FLIP mention with metadata
     """
 
     # Load committer index (with caching)
-    committer_index = get_committer_index(
-        KEYS_URL, KEYS_CACHE_PATH, force_refresh=False
-    )
+    if committer_index is None:
+        committer_index = get_committer_index(
+            KEYS_URL, KEYS_CACHE_PATH, force_refresh=False
+        )
 
     return generic_process_mbox_archive(
         filepath,
@@ -134,11 +150,15 @@ def process_mbox_archive(filepath: Path) -> DataFrame:
         vote_keyword="VOTE",
         discuss_keyword="DISCUSS",
         committer_index=committer_index,
+        mention_prefix="flip-",
     )
 
 
 def update_flip_mentions_cache(
-    new_mbox_files: list[Path], output_file: Path, mbox_directory: Path
+    new_mbox_files: list[Path],
+    output_file: Path,
+    mbox_directory: Path,
+    max_workers: int | None = None,
 ) -> DataFrame:
     """Update the flip mentions cache by processing new mbox files and appending to existing cache.
 
@@ -146,6 +166,7 @@ def update_flip_mentions_cache(
         new_mbox_files: List of newly downloaded mbox files to process
         output_file: Path to the flip_mentions.csv file
         mbox_directory: Directory containing mbox files
+        max_workers: Maximum number of processes used to process the mbox files
 
     Returns:
         The updated DataFrame with all mentions
@@ -157,26 +178,27 @@ def update_flip_mentions_cache(
         existing_mentions: DataFrame = load_mbox_cache_file(output_file)
     else:
         logger.info("No existing FLIP mentions file found, starting fresh")
-        existing_mentions = DataFrame(columns=FLIP_MENTION_COLUMNS)
+        existing_mentions = create_empty_mentions(FLIP_MENTION_COLUMNS)
 
     # Process new mbox files directly (no intermediate cache)
     logger.info("Processing %s new mbox file(s)", len(new_mbox_files))
-    new_mentions: DataFrame = DataFrame(columns=FLIP_MENTION_COLUMNS)
-
-    for mbox_file in new_mbox_files:
-        logger.info("Processing %s", mbox_file.name)
-        try:
-            file_data = process_mbox_archive(mbox_file)
-            new_mentions = concat((new_mentions, file_data), ignore_index=True)
-        except Exception as ex:
-            logger.error("Processing file %s: %s", mbox_file.name, ex)
+    new_mentions: list[DataFrame] = []
+    if new_mbox_files:
+        # Load the committer index once rather than in every worker process
+        committer_index = get_committer_index(
+            KEYS_URL, KEYS_CACHE_PATH, force_refresh=False
+        )
+        new_mentions, _ = process_mbox_files(
+            new_mbox_files,
+            partial(process_mbox_archive, committer_index=committer_index),
+            max_workers,
+        )
 
-    # Combine and deduplicate
-    combined: DataFrame = concat((existing_mentions, new_mentions), ignore_index=True)
-    combined = combined.drop_duplicates()
+    # Merge the new mentions into the cached mentions of any re-processed months
+    combined: DataFrame = merge_mentions(existing_mentions, new_mentions)
 
     # Save updated cache
-    combined.to_csv(output_file, index=False)
+    save_mbox_cache_file(combined, output_file)
     logger.info(
         "Saved updated FLIP mentions to %s (%s total mentions)",
         output_file,
@@ -197,16 +219,7 @@ def get_most_recent_mentions(flip_mentions: DataFrame) -> DataFrame:
         DataFrame with only the most recent mention of each type for each FLIP
     """
 
-    output = []
-
-    for _, flip_mention_data in flip_mentions.groupby(["flip", "mention_type"]):
-        output.append(
-            flip_mention_data[
-                flip_mention_data["timestamp"] == flip_mention_data["timestamp"].max()
-            ]
-        )
-
-    return concat(output, ignore_index=True)
+    return generic_get_most_recent_mentions(flip_mentions, "flip")
 
 
 def get_most_recent_mention_by_type(flip_mentions: DataFrame) -> DataFrame:
@@ -219,11 +232,4 @@ def get_most_recent_mention_by_type(flip_mentions: DataFrame) -> DataFrame:
         Pivot table with FLIP numbers as index and mention types as columns
     """
 
-    most_recent_flip_mentions: DataFrame = get_most_recent_mentions(flip_mentions)
-
-    most_recent: DataFrame = most_recent_flip_mentions.pivot_table(
-        index="flip", columns="mention_type", values="timestamp"
-    )
-    most_recent["overall"] = most_recent.max(axis=1, skipna=True, numeric_only=False)
-
-    return most_recent
+    return generic_get_most_recent_mention_by_type(flip_mentions, "flip")
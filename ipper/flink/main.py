@@ -2,13 +2,13 @@ import json
 import logging
 import sys
 from argparse import Namespace
+from functools import partial
 from pathlib import Path
 
-from pandas import DataFrame, concat
-
 from ipper.common.constants import DEFAULT_TEMPLATES_DIR
 from ipper.common.keys import get_committer_index
 from ipper.common.mailing_list import process_all_mbox_in_directory
+from ipper.common.utils import write_text_atomic
 from ipper.flink.mailing_list import (
     FLIP_MENTION_COLUMNS,
     KEYS_CACHE_PATH,
@@ -16,11 +16,13 @@ from ipper.flink.mailing_list import (
     get_multiple_mbox,
     load_mbox_cache_file,
     process_mbox_archive,
+    save_mbox_cache_file,
     update_flip_mentions_cache,
 )
 from ipper.flink.output import (
     FLINK_MAIN_PAGE_TEMPLATE,
     FLIP_RAW_INFO_PAGE_TEMPLATE,
+    enrich_flip_wiki_info_with_votes,
     render_flink_main_page,
     render_raw_info_pages,
 )
@@ -84,8 +86,7 @@ def process_wiki(args: Namespace) -> None:
         refresh_days=args.refresh_days,
     )
 
-    with open(flip_cache_path, "w", encoding="utf8") as flip_cache_file:
-        json.dump(flip_data, flip_cache_file)
+    write_text_atomic(flip_cache_path, json.dumps(flip_data))
 
 
 def process_output(args: Namespace) -> None:
@@ -97,12 +98,17 @@ def process_output(args: Namespace) -> None:
     with open(wiki_cache_path, encoding="utf8") as wiki_cache_file:
         wiki_cache_data = json.load(wiki_cache_file)
 
-    # Load mailing list mentions if available
-    flip_mentions = None
+    # Load mailing list mentions if available. The votes are added to the wiki
+    # data once here, rather than by each of the renderers.
     mentions_file = Path("cache/flink_mailbox_files/flip_mentions.csv")
     if mentions_file.exists():
         logger.info("Loading FLIP mentions from %s", mentions_file)
-        flip_mentions = load_mbox_cache_file(mentions_file)
+        flip_mentions = load_mbox_cache_file(
+            mentions_file, usecols=["flip", "from", "vote", "timestamp"]
+        )
+        wiki_cache_data = enrich_flip_wiki_info_with_votes(
+            wiki_cache_data, flip_mentions
+        )
     else:
         logger.info("No FLIP mentions file found, rendering without vote data")
 
@@ -111,7 +117,6 @@ def process_output(args: Namespace) -> None:
         args.main_page_file,
         args.template_dir,
         args.main_page_template_filename,
-        flip_mentions,
     )
 
     render_raw_info_pages(
@@ -119,7 +124,6 @@ def process_output(args: Namespace) -> None:
         args.raw_flip_dir,
         args.template_dir,
         args.raw_flip_template_filename,
-        flip_mentions,
     )
 
 
@@ -213,6 +217,15 @@ def setup_init_command(main_subparser):
         help="The number of FLIP pages to fetch at once.",
     )
 
+    init_parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        type=int,
+        help="The number of mbox files to process in parallel. "
+        + "Defaults to the number of CPUs.",
+    )
+
     init_parser.set_defaults(func=run_init_cmd)
 
 
@@ -235,6 +248,15 @@ def setup_refresh_command(main_subparser) -> None:
         help="Command for regenerating outputs from existing cache files without downloading",
     )
 
+    refresh_parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        type=int,
+        help="The number of mbox files to process in parallel. "
+        + "Defaults to the number of CPUs.",
+    )
+
     refresh_parser.set_defaults(func=run_refresh_cmd)
 
 
@@ -347,13 +369,17 @@ def process_mail_archives(args: Namespace) -> None:
     """Run the mail archive processing command"""
 
     out_dir: Path = Path(args.directory)
+    committer_index = get_committer_index(
+        KEYS_URL, KEYS_CACHE_PATH, force_refresh=False
+    )
     flip_mentions, errors = process_all_mbox_in_directory(
         out_dir,
-        process_mbox_archive,
+        partial(process_mbox_archive, committer_index=committer_index),
         FLIP_MENTION_COLUMNS,
+        getattr(args, "jobs", None),
     )
     output_file: Path = out_dir.joinpath("flip_mentions.csv")
-    flip_mentions.to_csv(output_file, index=False)
+    save_mbox_cache_file(flip_mentions, output_file)
     logger.info("Saved %s FLIP mentions to %s", len(flip_mentions), output_file)
 
 
@@ -412,24 +438,18 @@ def run_refresh_cmd(args: Namespace) -> None:
         )
         return
 
-    mbox_files: list[Path] = sorted(mbox_directory.glob("*.mbox"))
-
-    logger.info("Found %s mbox files to process", len(mbox_files))
-    all_mentions: DataFrame = DataFrame(columns=FLIP_MENTION_COLUMNS)
-
-    for mbox_file in mbox_files:
-        logger.info("Processing %s", mbox_file.name)
-        try:
-            file_data = process_mbox_archive(mbox_file)
-            all_mentions = concat((all_mentions, file_data), ignore_index=True)
-        except Exception as ex:
-            logger.error("Processing file %s: %s", mbox_file.name, ex)
-
-    # Deduplicate before saving
-    all_mentions = all_mentions.drop_duplicates()
+    committer_index = get_committer_index(
+        KEYS_URL, KEYS_CACHE_PATH, force_refresh=False
+    )
+    all_mentions, _ = process_all_mbox_in_directory(
+        mbox_directory,
+        partial(process_mbox_archive, committer_index=committer_index),
+        FLIP_MENTION_COLUMNS,
+        getattr(args, "jobs", None),
+    )
 
     output_file = mbox_directory / "flip_mentions.csv"
-    all_mentions.to_csv(output_file, index=False)
+    save_mbox_cache_file(all_mentions, output_file)
     logger.info("Saved %s FLIP mentions to %s", len(all_mentions), output_file)
 
 
@@ -1,29 +1,15 @@
-import datetime as dt
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, Template
 from pandas import DataFrame
 
-from ipper.common.constants import DATE_FORMAT, DEFAULT_TEMPLATES_DIR
+from ipper.common.constants import DEFAULT_TEMPLATES_DIR, VOTE_TYPES
 from ipper.common.mailing_list import create_vote_dict as _create_vote_dict
+from ipper.common.utils import current_date_string, get_template, write_text_atomic
 
 FLINK_MAIN_PAGE_TEMPLATE = "flink-index.html.jinja"
 FLIP_RAW_INFO_PAGE_TEMPLATE = "flip-more-info.html.jinja"
 
 
-def get_template(template_dir: str, template_filename) -> Template:
-
-    template_path = Path(template_dir).joinpath(Path(template_filename))
-    if not template_path.exists():
-        raise AttributeError(f"Template {template_path} not found")
-
-    template: Template = Environment(
-        loader=FileSystemLoader(template_dir)
-    ).get_template(template_filename)
-
-    return template
-
-
 def create_vote_dict(
     flip_mentions: DataFrame,
 ) -> dict[int, dict[str, list[dict[str, str]]]]:
@@ -57,10 +43,10 @@ def enrich_flip_wiki_info_with_votes(
         )
 
         if flip_id in vote_dict:
-            for vote in ["+1", "0", "-1"]:
+            for vote in VOTE_TYPES:
                 enriched_flip[vote] = vote_dict[flip_id][vote]
         else:
-            for vote in ["+1", "0", "-1"]:
+            for vote in VOTE_TYPES:
                 enriched_flip[vote] = []
 
         enriched_info[flip_id_str] = enriched_flip
@@ -102,7 +88,7 @@ def render_flink_main_page(
 
     output: str = template.render(
         flip_data=flip_data,
-        date=dt.datetime.now(dt.UTC).strftime(DATE_FORMAT),
+        date=current_date_string(),
     )
 
     with open(output_path, "w", encoding="utf8") as out_file:
@@ -135,14 +121,14 @@ def render_raw_info_pages(
     output_dir_path = Path(output_directory)
     output_dir_path.mkdir(parents=True, exist_ok=True)
 
+    date: str = current_date_string()
+
     for flip_id, flip in wiki_cache.items():
-        filename = f"FLIP-{flip_id}.html"
-        output_filepath = output_dir_path.joinpath(Path(filename))
+        output_filepath = output_dir_path.joinpath(f"FLIP-{flip_id}.html")
 
         output: str = template.render(
             flip_data=flip,
-            date=dt.datetime.now(dt.UTC).strftime(DATE_FORMAT),
+            date=date,
         )
 
-        with open(output_filepath, "w", encoding="utf8") as out_file:
-            out_file.write(output)
+        write_text_atomic(output_filepath, output)
@@ -1,13 +1,19 @@
 import logging
 import re
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
-from typing import Any, cast
+from typing import Any
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from lxml import etree, html
+from lxml.etree import ParserError
 
 from ipper.common.constants import NOT_SET_STR, UNKNOWN_STR, IPState
-from ipper.common.jira import JiraStatus, get_apache_jira_status
+from ipper.common.jira import (
+    JiraStatus,
+    get_apache_jira_status,
+    get_apache_jira_statuses,
+)
 from ipper.common.wiki import (
     APACHE_CONFLUENCE_BASE_URL,
     child_page_generator,
@@ -29,6 +35,20 @@ JIRA_LINK_KEY = "jira_link"
 RELEASE_COMPONENT_KEY = "release_component"
 RELEASE_VERSION_KEY = "release_version"
 FLINK_COMPONENT_STR = "Flink"
+FLIP_PROCESSING_WORKERS = 8
+
+# FLIPs which have reached one of these states are not refreshed from the wiki
+TERMINAL_STATES: frozenset[IPState] = frozenset(
+    {IPState.COMPLETED, IPState.NOT_ACCEPTED}
+)
+
+# We assume that the first table on the page is the summary table
+SUMMARY_TABLE_XPATH = "(//table)[1]"
+# The JIRA macro span(s) inside the first content wrapper div of a table cell
+JIRA_SPAN_XPATH = etree.XPath(
+    "(.//div[contains(concat(' ', normalize-space(@class), ' '), ' content-wrapper ')])[1]"
+    "//span[@class='jira-issue conf-macro output-block']"
+)
 
 
 def get_flip_main_page_info(timeout: int = 30) -> dict[str, Any]:
@@ -41,110 +61,119 @@ def get_flip_main_page_info(timeout: int = 30) -> dict[str, Any]:
     )
 
 
-def _find_Jira_key_and_link(row_data: Tag) -> tuple[str | None, str | None]:
-
-    jira_div = row_data.find("div", {"class": "content-wrapper"})
+def _find_Jira_key_and_link(
+    row_data: html.HtmlElement,
+) -> tuple[str | None, str | None]:
 
-    if jira_div:
-        jira_span = cast(Tag, jira_div).find(
-            "span",
-            {"class": "jira-issue conf-macro output-block"},
-        )
-    else:
+    jira_spans: list[html.HtmlElement] = JIRA_SPAN_XPATH(row_data)
+    if not jira_spans:
         return None, None
 
-    if jira_span:
-        if cast(Tag, jira_span).has_attr("data-jira-key"):
-            jira_id_values: list[str] | str | None = cast(Tag, jira_span).get(
-                "data-jira-key"
-            )
-            if isinstance(jira_id_values, list):
-                jira_id = jira_id_values[0]
-            else:
-                jira_id = cast(str, jira_id_values)
-        else:
-            jira_id = None
-
-        link = jira_span.find("a")
-        if link and cast(Tag, link).has_attr("href"):
-            jira_link_values: list[str] | str | None = cast(Tag, link).get("href")
-            if isinstance(jira_link_values, list):
-                jira_link = jira_link_values[0]
-            else:
-                jira_link = cast(str, jira_link_values)
-        else:
-            jira_link = None
+    jira_id: str | None = jira_spans[0].get("data-jira-key")
 
-        return jira_id, jira_link
+    link: html.HtmlElement | None = jira_spans[0].find(".//a")
+    jira_link: str | None = link.get("href") if link is not None else None
 
-    return None, None
+    return jira_id, jira_link
 
 
-def _add_row_data(
-    header: str, row_data: Tag, flip_dict: dict[str, str | int | list[str]]
+def _add_thread_link(
+    thread_key: str,
+    row_data: html.HtmlElement,
+    flip_dict: dict[str, str | int | list[str]],
 ) -> None:
 
-    if "discussion" in header:
-        if TEMPLATE_BOILER_PLATE_PREFIX in row_data.text:
-            flip_dict[DISCUSSION_THREAD_KEY] = NOT_SET_STR
-            return
+    if TEMPLATE_BOILER_PLATE_PREFIX in row_data.text_content():
+        flip_dict[thread_key] = NOT_SET_STR
+        return
 
-        link = row_data.find("a")
-        if link and isinstance(link, Tag):
-            href = link.get("href")
-            flip_dict[DISCUSSION_THREAD_KEY] = href if href else NOT_SET_STR
-        else:
-            flip_dict[DISCUSSION_THREAD_KEY] = NOT_SET_STR
+    link = row_data.find(".//a")
+    if link is not None:
+        href = link.get("href")
+        flip_dict[thread_key] = href if href else NOT_SET_STR
+    else:
+        flip_dict[thread_key] = NOT_SET_STR
 
-        return
 
-    if "vote" in header:
-        if TEMPLATE_BOILER_PLATE_PREFIX in row_data.text:
-            flip_dict[VOTE_THREAD_KEY] = NOT_SET_STR
-            return
+def _add_discussion_data(
+    row_data: html.HtmlElement, flip_dict: dict[str, str | int | list[str]]
+) -> None:
+    _add_thread_link(DISCUSSION_THREAD_KEY, row_data, flip_dict)
 
-        link = row_data.find("a")
-        if link and isinstance(link, Tag):
-            href = link.get("href")
-            flip_dict[VOTE_THREAD_KEY] = href if href else NOT_SET_STR
-        else:
-            flip_dict[VOTE_THREAD_KEY] = NOT_SET_STR
 
+def _add_vote_data(
+    row_data: html.HtmlElement, flip_dict: dict[str, str | int | list[str]]
+) -> None:
+    _add_thread_link(VOTE_THREAD_KEY, row_data, flip_dict)
+
+
+def _add_jira_data(
+    row_data: html.HtmlElement, flip_dict: dict[str, str | int | list[str]]
+) -> None:
+
+    if TEMPLATE_BOILER_PLATE_PREFIX in row_data.text_content():
+        flip_dict[JIRA_ID_KEY] = NOT_SET_STR
+        flip_dict[JIRA_LINK_KEY] = NOT_SET_STR
         return
 
-    if "jira" in header:
-        if TEMPLATE_BOILER_PLATE_PREFIX in row_data.text:
-            flip_dict[JIRA_ID_KEY] = NOT_SET_STR
-            flip_dict[JIRA_LINK_KEY] = NOT_SET_STR
-            return
+    jira_id, jira_link = _find_Jira_key_and_link(row_data)
 
-        jira_id, jira_link = _find_Jira_key_and_link(row_data)
+    if jira_id:
+        flip_dict[JIRA_ID_KEY] = jira_id
+    else:
+        flip_dict[JIRA_ID_KEY] = NOT_SET_STR
 
-        if jira_id:
-            flip_dict[JIRA_ID_KEY] = jira_id
-        else:
-            flip_dict[JIRA_ID_KEY] = NOT_SET_STR
+    if jira_link:
+        flip_dict[JIRA_LINK_KEY] = jira_link
+    else:
+        flip_dict[JIRA_LINK_KEY] = NOT_SET_STR
 
-        if jira_link:
-            flip_dict[JIRA_LINK_KEY] = jira_link
-        else:
-            flip_dict[JIRA_LINK_KEY] = NOT_SET_STR
 
-        return
+def _add_release_data(
+    row_data: html.HtmlElement, flip_dict: dict[str, str | int | list[str]]
+) -> None:
 
-    if "release" in header:
-        component, version = _get_release_version(row_data.text)
+    component, version = _get_release_version(row_data.text_content())
 
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug("\tTarget Release:")
         logger.debug("\t\tComponent:\t\t%s", component)
         logger.debug("\t\tVersion:\t\t%s", version)
 
-        if component:
-            flip_dict[RELEASE_COMPONENT_KEY] = component
-        else:
-            flip_dict[RELEASE_COMPONENT_KEY] = NOT_SET_STR
+    if component:
+        flip_dict[RELEASE_COMPONENT_KEY] = component
+    else:
+        flip_dict[RELEASE_COMPONENT_KEY] = NOT_SET_STR
+
+    flip_dict[RELEASE_VERSION_KEY] = version
+
+
+# Summary table row handlers, checked in order against the lower case row header.
+# Only the first matching handler is applied to a row.
+HEADER_HANDLERS: tuple[
+    tuple[
+        str,
+        Callable[[html.HtmlElement, dict[str, str | int | list[str]]], None],
+    ],
+    ...,
+] = (
+    ("discussion", _add_discussion_data),
+    ("vote", _add_vote_data),
+    ("jira", _add_jira_data),
+    ("release", _add_release_data),
+)
+
+
+def _add_row_data(
+    header: str,
+    row_data: html.HtmlElement,
+    flip_dict: dict[str, str | int | list[str]],
+) -> None:
 
-        flip_dict[RELEASE_VERSION_KEY] = version
+    for header_key, handler in HEADER_HANDLERS:
+        if header_key in header:
+            handler(row_data, flip_dict)
+            return
 
 
 def _get_release_version(release_row_text) -> tuple[str | None, str]:
@@ -164,10 +193,9 @@ def _get_release_version(release_row_text) -> tuple[str | None, str]:
     if len(release_split) == 3:
         version = release_split[1]
     else:
-        # We have more than 1 version numbers in the release text so we join them together
-        version = ", ".join(
-            sorted(RELEASE_NUMBER_PATTERN.findall(release_row_text.strip()))
-        )
+        # We have more than 1 version numbers in the release text so we join them
+        # together. The captured versions are every other entry of the split.
+        version = ", ".join(sorted(release_split[1::2]))
 
     return component, version
 
@@ -180,37 +208,52 @@ def check_if_set(flip_dict, key):
     return bool(flip_dict[key] != UNKNOWN_STR and flip_dict[key] != NOT_SET_STR)
 
 
-def _determine_state(flip_dict) -> IPState:
+def _get_jira_id(flip_dict) -> str | None:
+    """Returns the JIRA ID from the FLIP's JIRA link, if it has one."""
+
+    if not check_if_set(flip_dict, JIRA_LINK_KEY):
+        return None
+
+    jira_id_match: re.Match | None = FLINK_JIRA_PATTERN.search(flip_dict[JIRA_LINK_KEY])
+    if jira_id_match:
+        return jira_id_match.group()
+
+    return None
+
+
+def _determine_state(
+    flip_dict, jira_statuses: dict[str, JiraStatus] | None = None
+) -> IPState:
 
     has_discussion_thread = check_if_set(flip_dict, DISCUSSION_THREAD_KEY)
     has_vote_thread = check_if_set(flip_dict, VOTE_THREAD_KEY)
     has_jira = check_if_set(flip_dict, JIRA_LINK_KEY)
     has_target_release = check_if_set(flip_dict, RELEASE_VERSION_KEY)
 
-    logger.debug("\tDetermining state:")
-    logger.debug("\t\tDiscussion Thread:\t%s", has_discussion_thread)
-    logger.debug("\t\tVote Thread:\t\t%s", has_vote_thread)
-    logger.debug("\t\tJIRA:\t\t\t%s", has_jira)
-    logger.debug("\t\tTarget Release:\t\t%s", has_target_release)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\tDetermining state:")
+        logger.debug("\t\tDiscussion Thread:\t%s", has_discussion_thread)
+        logger.debug("\t\tVote Thread:\t\t%s", has_vote_thread)
+        logger.debug("\t\tJIRA:\t\t\t%s", has_jira)
+        logger.debug("\t\tTarget Release:\t\t%s", has_target_release)
 
     if has_discussion_thread and not has_jira and not has_target_release:
         logger.debug("\t\tFLIP State:\t\t%s", IPState.UNDER_DISCUSSION)
         return IPState.UNDER_DISCUSSION
 
     if has_jira:
-        jira_id_match: re.Match | None = FLINK_JIRA_PATTERN.search(
-            flip_dict[JIRA_LINK_KEY]
-        )
-        if jira_id_match:
-            jira_id = jira_id_match.group()
-        else:
+        jira_id = _get_jira_id(flip_dict)
+        if not jira_id:
             logger.warning(
                 "Could not find JIRA ID from url: %s", flip_dict[JIRA_LINK_KEY]
             )
             logger.debug("\t\tFLIP State:\t\t%s", IPState.UNKNOWN)
             return IPState.UNKNOWN
 
-        jira_state: JiraStatus = get_apache_jira_status(jira_id)
+        if jira_statuses and jira_id in jira_statuses:
+            jira_state: JiraStatus = jira_statuses[jira_id]
+        else:
+            jira_state = get_apache_jira_status(jira_id)
         logger.debug("\t\tJIRA State:\t\t%s", jira_state)
 
         if jira_state == JiraStatus.RESOLVED:
@@ -233,11 +276,15 @@ def _determine_state(flip_dict) -> IPState:
 
 
 def _enrich_flip_info(
-    flip_id: int, body_html: str, flip_dict: dict[str, str | int | list[str]]
+    flip_id: int,
+    body_html: str,
+    flip_dict: dict[str, str | int | list[str]],
+    determine_state: bool = True,
 ) -> None:
     """Parses the body of the FLIP wiki page pointed to by the 'content_url'
     key in the supplied dictionary. It will add the derived data to the
-    supplied dict.
+    supplied dict. If determine_state is False the state is left as unknown,
+    so that it can be set later once the JIRA statuses have been fetched.
 
     Search process:
         1. Find the first table in the body (some flips don't have a table and will be ignored)
@@ -247,9 +294,13 @@ def _enrich_flip_info(
         4.
     """
 
-    parsed_body: BeautifulSoup = BeautifulSoup(body_html, "html.parser")
-
-    tables = parsed_body.find_all("table")
+    try:
+        summary_tables: list[html.HtmlElement] = html.fromstring(body_html).xpath(
+            SUMMARY_TABLE_XPATH
+        )
+    except ParserError:
+        # The page body is empty
+        summary_tables = []
 
     # Setup the status entries to default unknown
     flip_dict[DISCUSSION_THREAD_KEY] = UNKNOWN_STR
@@ -258,7 +309,7 @@ def _enrich_flip_info(
     flip_dict[RELEASE_VERSION_KEY] = UNKNOWN_STR
     flip_dict["state"] = IPState.UNKNOWN
 
-    if not tables:
+    if not summary_tables:
         logger.warning(
             "No summary table in FLIP-%s. This FLIP state will be set to %s.",
             flip_id,
@@ -266,9 +317,7 @@ def _enrich_flip_info(
         )
         return
 
-    # We assume that the first table on the page is the summary table
-    summary_table = tables[0]
-    summary_rows = summary_table.findAll("tr")
+    summary_rows: list[html.HtmlElement] = summary_tables[0].xpath(".//tr")
     if not summary_rows:
         logger.warning(
             "No information in summary table in FLIP-%s. "
@@ -279,21 +328,22 @@ def _enrich_flip_info(
         return
 
     for row in summary_rows:
-        header_tag = row.find("th")
-        if header_tag:
-            header = header_tag.text.lower()
+        header_tag = row.find(".//th")
+        if header_tag is not None:
+            header = header_tag.text_content().lower()
         else:
             # We have no idea what this row is
             continue
 
-        row_data = row.find("td")
-        if row_data:
+        row_data = row.find(".//td")
+        if row_data is not None:
             _add_row_data(header, row_data, flip_dict)
 
-    flip_dict["state"] = _determine_state(flip_dict)
+    if determine_state:
+        flip_dict["state"] = _determine_state(flip_dict)
 
 
-def process_child_kip(flip_id: int, child: dict):
+def process_child_kip(flip_id: int, child: dict, determine_state: bool = True):
     """Process and enrich the KIP child page dictionary"""
 
     logger.info("Processing FLIP %s wiki page", flip_id)
@@ -308,7 +358,9 @@ def process_child_kip(flip_id: int, child: dict):
     child_dict["last_modified_by"] = child["history"]["lastUpdated"]["by"][
         "displayName"
     ]
-    _enrich_flip_info(flip_id, child["body"]["view"]["value"], child_dict)
+    _enrich_flip_info(
+        flip_id, child["body"]["view"]["value"], child_dict, determine_state
+    )
 
     return child_dict
 
@@ -335,48 +387,83 @@ def get_flip_information(
     else:
         logger.info("Downloading FLIP Wiki information for all FLIPs")
 
-    for child in child_page_generator(flip_main_info, chunk, timeout):
-        flip_match: re.Match | None = re.search(FLIP_PATTERN, child["title"])
-        if flip_match:
-            flip_id: int = int(flip_match.groupdict()["flip"])
-
-            # Check if FLIP already exists in cache
-            if flip_id in output:
-                # Parse the created_on date from the cached FLIP
-                try:
-                    created_on_str = output[flip_id]["created_on"]
-                    # Handle ISO format with 'Z' or timezone info
-                    created_date = datetime.fromisoformat(
-                        created_on_str.replace("Z", "+00:00")
-                    )
-
-                    # Skip if FLIP was created outside the refresh window
-                    if created_date < refresh_cutoff:
+    # Parse the FLIP pages in worker threads, so that parsing overlaps with the
+    # download of the next page of results
+    pending: dict[int, Future] = {}
+    with ThreadPoolExecutor(max_workers=FLIP_PROCESSING_WORKERS) as executor:
+        for child in child_page_generator(flip_main_info, chunk, timeout):
+            title: str = child["title"]
+            # Cheap literal check to skip non-FLIP pages before running the regex
+            if "flip-" not in title.lower():
+                continue
+
+            flip_match: re.Match | None = FLIP_PATTERN.search(title)
+            if flip_match:
+                flip_id: int = int(flip_match.groupdict()["flip"])
+
+                # Check if FLIP already exists in cache
+                if flip_id in output:
+                    cached_state = output[flip_id].get("state")
+                    if cached_state in TERMINAL_STATES:
                         logger.info(
-                            "Skipping FLIP-%s (created %s, outside %s-day "
-                            "refresh window)",
+                            "Skipping FLIP-%s (already in terminal state %s)",
                             flip_id,
-                            created_on_str,
-                            refresh_days,
+                            cached_state,
                         )
                         continue
-                    else:
-                        logger.info(
-                            "Refreshing FLIP-%s (created recently: %s)",
+
+                    # Parse the created_on date from the cached FLIP
+                    try:
+                        created_on_str = output[flip_id]["created_on"]
+                        # fromisoformat handles the 'Z' UTC suffix natively
+                        created_date = datetime.fromisoformat(created_on_str)
+
+                        # Skip if FLIP was created outside the refresh window
+                        if created_date < refresh_cutoff:
+                            logger.info(
+                                "Skipping FLIP-%s (created %s, outside %s-day "
+                                "refresh window)",
+                                flip_id,
+                                created_on_str,
+                                refresh_days,
+                            )
+                            continue
+                        else:
+                            logger.info(
+                                "Refreshing FLIP-%s (created recently: %s)",
+                                flip_id,
+                                created_on_str,
+                            )
+                    except (KeyError, ValueError) as e:
+                        logger.warning(
+                            "Could not parse created_on date for FLIP-%s, "
+                            "refreshing anyway: %s",
                             flip_id,
-                            created_on_str,
+                            e,
                         )
-                except (KeyError, ValueError) as e:
-                    logger.warning(
-                        "Could not parse created_on date for FLIP-%s, "
-                        "refreshing anyway: %s",
-                        flip_id,
-                        e,
-                    )
-
-            output[flip_id] = process_child_kip(flip_id, child)
-
-            if flip_id not in (existing_cache or {}):
-                logger.info("Added new FLIP-%s to cache", flip_id)
+
+                pending[flip_id] = executor.submit(
+                    process_child_kip, flip_id, child, determine_state=False
+                )
+
+    for flip_id, future in pending.items():
+        output[flip_id] = future.result()
+
+        if flip_id not in (existing_cache or {}):
+            logger.info("Added new FLIP-%s to cache", flip_id)
+
+    # Fetch the JIRA statuses for all processed FLIPs in bulk, rather than one
+    # request per FLIP, and then determine each FLIP's state
+    jira_ids: list[str] = []
+    for flip_id in pending:
+        jira_id = _get_jira_id(output[flip_id])
+        if jira_id:
+            jira_ids.append(jira_id)
+
+    logger.info("Fetching JIRA statuses for %s FLIPs", len(jira_ids))
+    jira_statuses: dict[str, JiraStatus] = get_apache_jira_statuses(jira_ids)
+
+    for flip_id in pending:
+        output[flip_id]["state"] = _determine_state(output[flip_id], jira_statuses)
 
     return output
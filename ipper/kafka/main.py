@@ -1,10 +1,17 @@
 import logging
-from argparse import ArgumentParser, Namespace
+from argparse import Namespace
+from functools import partial
 from pathlib import Path
 
-from pandas import DataFrame, concat
+from pandas import DataFrame
 
 from ipper.common.keys import get_committer_index
+from ipper.common.mailing_list import (
+    combine_mentions,
+    drop_duplicate_mentions,
+    process_mbox_files,
+)
+from ipper.common.wiki import WIKI_DOWNLOAD_WORKERS
 from ipper.kafka.mailing_list import (
     KEYS_CACHE_PATH,
     KEYS_URL,
@@ -12,14 +19,16 @@ from ipper.kafka.mailing_list import (
     get_multiple_mbox,
     load_mbox_cache_file,
     process_mbox_archive,
+    save_mbox_cache_file,
     update_kip_mentions_cache,
 )
 from ipper.kafka.output import (
+    create_vote_dict,
     enrich_kip_wiki_info_with_votes,
     render_kip_info_pages,
     render_standalone_status_page,
 )
-from ipper.kafka.wiki import get_kip_information, get_kip_main_page_info
+from ipper.kafka.wiki import get_kip_information
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +85,15 @@ def setup_init_command(main_subparser):
         help="The number of KIP pages to fetch at once.",
     )
 
+    init_parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        type=int,
+        help="The number of mbox files to process in parallel. "
+        + "Defaults to the number of CPUs.",
+    )
+
     init_parser.set_defaults(func=run_init_cmd)
 
 
@@ -98,6 +116,15 @@ def setup_refresh_command(main_subparser) -> None:
         help="Command for regenerating outputs from existing cache files without downloading",
     )
 
+    refresh_parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        type=int,
+        help="The number of mbox files to process in parallel. "
+        + "Defaults to the number of CPUs.",
+    )
+
     refresh_parser.set_defaults(func=run_refresh_cmd)
 
 
@@ -160,6 +187,15 @@ def setup_wiki_command(main_subparser):
         ),
     )
 
+    wiki_download_subparser.add_argument(
+        "-n",
+        "--concurrency",
+        required=False,
+        type=int,
+        default=WIKI_DOWNLOAD_WORKERS,
+        help="The number of chunks of KIP pages to fetch at once.",
+    )
+
     wiki_download_subparser.set_defaults(func=setup_wiki_download)
 
 
@@ -218,15 +254,35 @@ def setup_mail_download(args: Namespace) -> list[Path]:
 def setup_wiki_download(args: Namespace) -> None:
     """Run the KIP wiki information download"""
 
-    kip_main_info = get_kip_main_page_info()
     get_kip_information(
-        kip_main_info,
         chunk=args.chunk,
         update=args.update,
         overwrite_cache=args.overwrite,
+        workers=getattr(args, "concurrency", WIKI_DOWNLOAD_WORKERS),
     )
 
 
+def _process_mbox_files(
+    mbox_files: list[Path], max_workers: int | None = None
+) -> DataFrame:
+    """Process the supplied mbox files in parallel and combine their KIP mentions.
+    Files which fail to process are logged and skipped."""
+
+    # Load the committer index once rather than in every worker process
+    committer_index = get_committer_index(
+        KEYS_URL, KEYS_CACHE_PATH, force_refresh=False
+    )
+    file_mentions, _ = process_mbox_files(
+        mbox_files,
+        partial(process_mbox_archive, committer_index=committer_index),
+        max_workers,
+    )
+
+    # Combine the mentions once at the end, rather than copying the growing
+    # DataFrame for every file
+    return combine_mentions(file_mentions, KIP_MENTION_COLUMNS)
+
+
 def run_init_cmd(args: Namespace) -> None:
     logger.info("Initializing all data caches")
     logger.info("Downloading KIP Wiki Information")
@@ -241,20 +297,12 @@ def run_init_cmd(args: Namespace) -> None:
 
     # Process all mbox files directly (no intermediate cache)
     logger.info("Processing mbox files")
-    all_mentions: DataFrame = DataFrame(columns=KIP_MENTION_COLUMNS)
-
-    for mbox_file in mbox_files:
-        logger.info("Processing %s", mbox_file.name)
-        try:
-            file_data = process_mbox_archive(mbox_file)
-            all_mentions = concat((all_mentions, file_data), ignore_index=True)
-        except Exception as ex:
-            logger.error("Processing file %s: %s", mbox_file.name, ex)
+    all_mentions: DataFrame = _process_mbox_files(mbox_files, args.jobs)
 
     # Deduplicate and save
-    all_mentions = all_mentions.drop_duplicates()
+    all_mentions = drop_duplicate_mentions(all_mentions)
     output_file = Path("cache/mailbox_files/kip_mentions.csv")
-    all_mentions.to_csv(output_file, index=False)
+    save_mbox_cache_file(all_mentions, output_file)
     logger.info("Saved %s KIP mentions to %s", len(all_mentions), output_file)
 
 
@@ -288,36 +336,37 @@ def run_refresh_cmd(args: Namespace) -> None:
     mbox_files: list[Path] = sorted(mbox_directory.glob("*.mbox"))
 
     logger.info("Found %s mbox files to process", len(mbox_files))
-    all_mentions: DataFrame = DataFrame(columns=KIP_MENTION_COLUMNS)
-
-    for mbox_file in mbox_files:
-        logger.info("Processing %s", mbox_file.name)
-        try:
-            file_data = process_mbox_archive(mbox_file)
-            all_mentions = concat((all_mentions, file_data), ignore_index=True)
-        except Exception as ex:
-            logger.error("Processing file %s: %s", mbox_file.name, ex)
+    all_mentions: DataFrame = _process_mbox_files(mbox_files, args.jobs)
 
     # Deduplicate before saving (important!)
-    all_mentions = all_mentions.drop_duplicates()
+    all_mentions = drop_duplicate_mentions(all_mentions)
 
     output_file = mbox_directory / "kip_mentions.csv"
-    all_mentions.to_csv(output_file, index=False)
+    save_mbox_cache_file(all_mentions, output_file)
     logger.info("Saved %s KIP mentions to %s", len(all_mentions), output_file)
 
 
 def run_output_standalone_cmd(args: Namespace) -> None:
     cache_file = Path(args.kip_mentions_file)
     kip_mentions: DataFrame = load_mbox_cache_file(cache_file)
-    render_standalone_status_page(kip_mentions, args.output_file)
+    # The wiki information is only fetched if it has not been cached, and is
+    # shared by the status page and the individual KIP pages
+    kip_wiki_info = get_kip_information()
+    # The votes are likewise aggregated once for both sets of pages
+    vote_dict = create_vote_dict(kip_mentions)
+    render_standalone_status_page(
+        kip_mentions,
+        args.output_file,
+        kip_wiki_info=kip_wiki_info,
+        vote_dict=vote_dict,
+    )
 
     # Generate individual KIP info pages if directory is specified
     if args.kip_info_dir:
-        kip_main_info = get_kip_main_page_info()
-        kip_wiki_info = get_kip_information(kip_main_info)
-
         # Enrich with vote data
-        enriched_kip_info = enrich_kip_wiki_info_with_votes(kip_wiki_info, kip_mentions)
+        enriched_kip_info = enrich_kip_wiki_info_with_votes(
+            kip_wiki_info, kip_mentions, vote_dict
+        )
 
         # Render individual pages
         render_kip_info_pages(enriched_kip_info, args.kip_info_dir)
@@ -350,12 +399,3 @@ def run_keys_info_cmd(args: Namespace) -> None:
         print(f"  - {committer.name} ({', '.join(committer.emails[:2])})")
     if len(index.committers) > 5:
         print(f"  ... and {len(index.committers) - 5} more")
-
-
-if __name__ == "__main__":
-    PARSER: ArgumentParser = ArgumentParser(
-        "Kafka Improvement Proposal Enrichment Program"
-    )
-    setup_kafka_parser(PARSER)
-    ARGS: Namespace = PARSER.parse_args()
-    ARGS.func(ARGS)
@@ -4,17 +4,16 @@ from enum import Enum
 from pathlib import Path
 from typing import cast
 
-from jinja2 import Environment, FileSystemLoader, Template
-from pandas import DataFrame, Series, Timedelta, Timestamp, to_datetime
+from jinja2 import Template
+from pandas import DataFrame, Timedelta, Timestamp, to_datetime
 
-from ipper.common.constants import DATE_FORMAT, DEFAULT_TEMPLATES_DIR, IPState
+from ipper.common.constants import DEFAULT_TEMPLATES_DIR, VOTE_TYPES, IPState
 from ipper.common.mailing_list import create_vote_dict as _create_vote_dict
-from ipper.common.utils import calculate_age
+from ipper.common.utils import current_date_string, format_age, get_template
 from ipper.common.wiki import APACHE_CONFLUENCE_DATE_FORMAT
 from ipper.kafka.mailing_list import get_most_recent_mention_by_type
 from ipper.kafka.wiki import (
     get_kip_information,
-    get_kip_main_page_info,
 )
 
 KIP_SPLITTER: re.Pattern = re.compile(r"KIP-\d+\W?[:-]?\W?", re.IGNORECASE)
@@ -38,11 +37,15 @@ class KIPStatus(Enum):
         self.duration = duration
 
 
-def calculate_status(last_mention: Timestamp) -> KIPStatus:
+def calculate_status(
+    last_mention: Timestamp, now: dt.datetime | None = None
+) -> KIPStatus:
     """Calculates the appropriate KIPStatus instance based on the time
-    difference between now and the last mention."""
+    difference between now (the current time unless supplied) and the last
+    mention."""
 
-    now: Timestamp = to_datetime(dt.datetime.now(dt.UTC), utc=True)
+    if now is None:
+        now = dt.datetime.now(dt.UTC)
     diff: Timedelta = now - last_mention
 
     if diff <= KIPStatus.GREEN.duration:
@@ -79,9 +82,9 @@ def get_state_emoji(state: str) -> str:
 def clean_description(description: str):
     """Cleans the kips description of the KIP-XXX string"""
 
-    kip_match: re.Match | None = re.match(KIP_SPLITTER, description)
+    kip_match: re.Match | None = KIP_SPLITTER.match(description)
     if kip_match:
-        return description[kip_match.span()[1] :].strip()
+        return description[kip_match.end() :].strip()
 
     return description
 
@@ -94,19 +97,38 @@ def create_vote_dict(
 
 
 def create_status_dict(
-    kip_mentions: DataFrame, kip_wiki_info: dict[int, dict[str, int | str]]
+    kip_mentions: DataFrame,
+    kip_wiki_info: dict[int, dict[str, int | str]],
+    vote_dict: dict[int, dict[str, list[dict[str, str]]]] | None = None,
 ) -> list[dict[str, int | str | None | KIPStatus | list[dict[str, str]]]]:
     """Calculate a status for each KIP. For KIPs under discussion, calculate status
-    based on how recently it was mentioned in email subject. For other KIPs, use emoji."""
+    based on how recently it was mentioned in email subject. For other KIPs, use emoji.
+    The vote dictionary is created from the mentions if it is not supplied."""
+
+    now: dt.datetime = dt.datetime.now(dt.UTC)
 
     recent_mentions: DataFrame = get_most_recent_mention_by_type(kip_mentions)
 
-    subject_mentions: Series = recent_mentions["subject"].dropna()
+    subject_mentions: dict[int, Timestamp] = (
+        recent_mentions["subject"].dropna().to_dict()
+    )
 
-    vote_dict: dict[int, dict[str, list[dict[str, str]]]] = create_vote_dict(
-        kip_mentions
+    # Parse all the creation dates in one call rather than once or twice per KIP
+    created_on: dict[int, dt.datetime] = dict(
+        zip(
+            kip_wiki_info.keys(),
+            to_datetime(
+                [kip_data["created_on"] for kip_data in kip_wiki_info.values()],
+                format=APACHE_CONFLUENCE_DATE_FORMAT,
+                utc=True,
+            ).to_pydatetime(),
+            strict=True,
+        )
     )
 
+    if vote_dict is None:
+        vote_dict = create_vote_dict(kip_mentions)
+
     output: list[dict[str, int | str | None | KIPStatus | list[dict[str, str]]]] = []
     for kip_id in sorted(kip_wiki_info.keys(), reverse=True):
         kip_data: dict[str, int | str] = kip_wiki_info[kip_id]
@@ -118,25 +140,19 @@ def create_status_dict(
         status_entry["url"] = kip_data["web_url"]
         status_entry["created_by"] = kip_data["created_by"]
         status_entry["state"] = kip_data["state"]
-        status_entry["age"] = calculate_age(
-            cast(str, kip_data["created_on"]), APACHE_CONFLUENCE_DATE_FORMAT
-        )
+        status_entry["age"] = format_age(created_on[kip_id], now)
 
         # Only calculate colored status for KIPs under discussion
         if kip_data["state"] == IPState.UNDER_DISCUSSION:
             if kip_id in subject_mentions:
-                status_entry["status"] = calculate_status(subject_mentions[kip_id])
+                last_mention_ts: Timestamp = subject_mentions[kip_id]
+                status_entry["status"] = calculate_status(last_mention_ts, now)
                 # Store the last mention date for tooltip display
-                last_mention_ts = subject_mentions[kip_id]
-                status_entry["last_mention_age"] = calculate_age(
-                    last_mention_ts.strftime("%Y-%m-%d %H:%M:%S"), "%Y-%m-%d %H:%M:%S"
+                status_entry["last_mention_age"] = format_age(
+                    last_mention_ts.floor("s").to_pydatetime(), now
                 )
             else:
-                created_diff: dt.timedelta = dt.datetime.now(
-                    dt.UTC
-                ) - dt.datetime.strptime(
-                    cast(str, kip_data["created_on"]), APACHE_CONFLUENCE_DATE_FORMAT
-                ).replace(tzinfo=dt.UTC)
+                created_diff: dt.timedelta = now - created_on[kip_id]
                 if created_diff <= dt.timedelta(days=28):
                     status_entry["status"] = KIPStatus.BLUE
                 else:
@@ -150,11 +166,9 @@ def create_status_dict(
             status_entry["last_mention_age"] = None
             status_entry["emoji"] = get_state_emoji(cast(str, kip_data["state"]))
 
-        for vote in ["+1", "0", "-1"]:
-            if kip_id in vote_dict:
-                status_entry[vote] = vote_dict[kip_id][vote]
-            else:
-                status_entry[vote] = []
+        kip_votes: dict[str, list[dict[str, str]]] | None = vote_dict.get(kip_id)
+        for vote in VOTE_TYPES:
+            status_entry[vote] = kip_votes[vote] if kip_votes else []
 
         output.append(status_entry)
 
@@ -166,27 +180,29 @@ def render_standalone_status_page(
     output_filename: str,
     templates_dir: str = DEFAULT_TEMPLATES_DIR,
     template_filename: str = KAFKA_MAIN_PAGE_TEMPLATE,
+    kip_wiki_info: dict[int, dict[str, int | str]] | None = None,
+    vote_dict: dict[int, dict[str, list[dict[str, str]]]] | None = None,
 ) -> None:
-    """Renders the KIPs table with status entries based on state and recent activity."""
+    """Renders the KIPs table with status entries based on state and recent activity.
+    The KIP wiki information is loaded from the cache and the vote dictionary is
+    created from the mentions if they are not supplied."""
 
     output_path: Path = Path(output_filename)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    kip_main_info = get_kip_main_page_info()
-    kip_wiki_info = get_kip_information(kip_main_info)
+    if kip_wiki_info is None:
+        kip_wiki_info = get_kip_information()
 
     kip_status: list[dict[str, int | str | None | KIPStatus | list[dict[str, str]]]] = (
-        create_status_dict(kip_mentions, kip_wiki_info)
+        create_status_dict(kip_mentions, kip_wiki_info, vote_dict)
     )
 
-    template: Template = Environment(
-        loader=FileSystemLoader(templates_dir)
-    ).get_template(template_filename)
+    template: Template = get_template(templates_dir, template_filename)
 
     output: str = template.render(
         kip_status=kip_status,
         kip_status_enum=KIPStatus,
-        date=dt.datetime.now(dt.UTC).strftime(DATE_FORMAT),
+        date=current_date_string(),
     )
 
     with open(output_path, "w", encoding="utf8") as out_file:
@@ -196,22 +212,23 @@ def render_standalone_status_page(
 def enrich_kip_wiki_info_with_votes(
     kip_wiki_info: dict[int, dict[str, int | str]],
     kip_mentions: DataFrame,
+    vote_dict: dict[int, dict[str, list[dict[str, str]]]] | None = None,
 ) -> dict[int, dict[str, int | str | list[dict[str, str]]]]:
-    """Enriches KIP wiki information with vote data from mailing list mentions."""
+    """Enriches KIP wiki information with vote data from mailing list mentions.
+    The vote dictionary is created from the mentions if it is not supplied."""
 
-    vote_dict: dict[int, dict[str, list[dict[str, str]]]] = create_vote_dict(
-        kip_mentions
-    )
+    if vote_dict is None:
+        vote_dict = create_vote_dict(kip_mentions)
 
     enriched_info: dict[int, dict[str, int | str | list[dict[str, str]]]] = {}
     for kip_id, kip_data in kip_wiki_info.items():
         enriched_kip: dict[str, int | str | list[dict[str, str]]] = dict(kip_data)
 
         if kip_id in vote_dict:
-            for vote in ["+1", "0", "-1"]:
+            for vote in VOTE_TYPES:
                 enriched_kip[vote] = vote_dict[kip_id][vote]
         else:
-            for vote in ["+1", "0", "-1"]:
+            for vote in VOTE_TYPES:
                 enriched_kip[vote] = []
 
         enriched_info[kip_id] = enriched_kip
@@ -227,12 +244,11 @@ def render_kip_info_pages(
 ) -> None:
     """Renders individual more info pages for each KIP."""
 
-    template: Template = Environment(
-        loader=FileSystemLoader(template_dir)
-    ).get_template(template_filename)
+    template: Template = get_template(template_dir, template_filename)
 
     output_dir_path = Path(output_directory)
     output_dir_path.mkdir(parents=True, exist_ok=True)
+    date: str = current_date_string()
 
     for kip_id, kip in kip_wiki_info.items():
         filename = f"KIP-{kip_id}.html"
@@ -240,7 +256,7 @@ def render_kip_info_pages(
 
         output: str = template.render(
             kip_data=kip,
-            date=dt.datetime.now(dt.UTC).strftime(DATE_FORMAT),
+            date=date,
         )
 
         with open(output_filepath, "w", encoding="utf8") as out_file:
@@ -1,6 +1,7 @@
 import json
 import logging
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, cast
 
@@ -8,8 +9,10 @@ from bs4 import BeautifulSoup
 from bs4.element import Tag
 
 from ipper.common.constants import NOT_SET_STR, UNKNOWN_STR, IPState
+from ipper.common.utils import write_text_atomic
 from ipper.common.wiki import (
     APACHE_CONFLUENCE_BASE_URL,
+    WIKI_DOWNLOAD_WORKERS,
     child_page_generator,
     get_wiki_page_body,
     get_wiki_page_info,
@@ -18,6 +21,7 @@ from ipper.common.wiki import (
 logger = logging.getLogger(__name__)
 
 KIP_PATTERN: re.Pattern = re.compile(r"KIP-(?P<kip>\d+)", re.IGNORECASE)
+KIP_PROCESSING_WORKERS = 8
 
 # Template default values that indicate the field was not actually set
 KIP_TEMPLATE_DEFAULT_DISCUSSION_URL = (
@@ -25,6 +29,12 @@ KIP_TEMPLATE_DEFAULT_DISCUSSION_URL = (
     "%3CCAOeJiJh6Vkkca85bWYgkeOZ8rC6%2BKDh7zzq8vMKECL_7PNExTA%40mail.gmail.com%3E"
 )
 KIP_TEMPLATE_DEFAULT_JIRA_URL = "https://issues.apache.org/jira/browse/KAFKA-1"
+# Map field types to their template default URLs. There is no known default for
+# the voting thread, as voting is usually added later.
+KIP_TEMPLATE_DEFAULT_URLS: dict[str, str] = {
+    "discussion": KIP_TEMPLATE_DEFAULT_DISCUSSION_URL,
+    "jira": KIP_TEMPLATE_DEFAULT_JIRA_URL,
+}
 KIP_TEMPLATE_DEFAULT_STATE_PATTERN: re.Pattern = re.compile(
     r'\[one of\s+"', re.IGNORECASE
 )
@@ -86,13 +96,15 @@ def get_current_state(html: str) -> str | None:
     if KIP_TEMPLATE_DEFAULT_STATE_PATTERN.search(html):
         return None
 
-    if any(option in html.lower() for option in ACCEPTED_TERMS):
+    lower_html: str = html.lower()
+
+    if any(option in lower_html for option in ACCEPTED_TERMS):
         return IPState.ACCEPTED
 
-    if any(option in html.lower() for option in UNDER_DISCUSSION_TERMS):
+    if any(option in lower_html for option in UNDER_DISCUSSION_TERMS):
         return IPState.UNDER_DISCUSSION
 
-    if any(option in html.lower() for option in NOT_ACCEPTED_TERMS):
+    if any(option in lower_html for option in NOT_ACCEPTED_TERMS):
         return IPState.NOT_ACCEPTED
 
     return None
@@ -114,17 +126,7 @@ def is_template_default_url(url: list | str | None, field_type: str) -> bool:
     # Handle list-type href values
     url_str = url[0] if isinstance(url, list) else url
 
-    # Map field types to their default URLs
-    defaults = {
-        "discussion": KIP_TEMPLATE_DEFAULT_DISCUSSION_URL,
-        "jira": KIP_TEMPLATE_DEFAULT_JIRA_URL,
-        "vote": None,  # No known default for voting thread (voting is usually added later)
-    }
-
-    default_url = defaults.get(field_type)
-    if default_url is None:
-        return False
-    return url_str == default_url
+    return url_str == KIP_TEMPLATE_DEFAULT_URLS.get(field_type)
 
 
 def enrich_kip_info(body_html: str, kip_dict: dict[str, list[str] | str | int]) -> None:
@@ -132,7 +134,7 @@ def enrich_kip_info(body_html: str, kip_dict: dict[str, list[str] | str | int])
     key in the supplied dictionary. It will add the derived data to the
     supplied dict."""
 
-    parsed_body: BeautifulSoup = BeautifulSoup(body_html, "html.parser")
+    parsed_body: BeautifulSoup = BeautifulSoup(body_html, "lxml")
 
     state_processed: bool = False
     jira_processed: bool = False
@@ -140,8 +142,19 @@ def enrich_kip_info(body_html: str, kip_dict: dict[str, list[str] | str | int])
     vote_processed: bool = False
 
     for para in parsed_body.find_all("p"):
-        if not state_processed and "current state" in para.text.lower():
-            state: str | None = get_current_state(para.text)
+        if (
+            state_processed
+            and jira_processed
+            and discussion_processed
+            and vote_processed
+        ):
+            break
+
+        para_text: str = para.text
+        lower_text: str = para_text.lower()
+
+        if not state_processed and "current state" in lower_text:
+            state: str | None = get_current_state(para_text)
             if state:
                 kip_dict["state"] = state
             else:
@@ -150,7 +163,7 @@ def enrich_kip_info(body_html: str, kip_dict: dict[str, list[str] | str | int])
 
             state_processed = True
 
-        elif not jira_processed and "jira" in para.text.lower():
+        elif not jira_processed and "jira" in lower_text:
             link = para.find("a")
             href = link.get("href") if link else None
 
@@ -162,7 +175,7 @@ def enrich_kip_info(body_html: str, kip_dict: dict[str, list[str] | str | int])
 
             jira_processed = True
 
-        elif not discussion_processed and "discussion thread" in para.text.lower():
+        elif not discussion_processed and "discussion thread" in lower_text:
             link = para.find("a")
             href = link.get("href") if link else None
 
@@ -176,7 +189,7 @@ def enrich_kip_info(body_html: str, kip_dict: dict[str, list[str] | str | int])
 
             discussion_processed = True
 
-        elif not vote_processed and "vote thread" in para.text.lower():
+        elif not vote_processed and "vote thread" in lower_text:
             link = para.find("a")
             href = link.get("href") if link else None
 
@@ -224,15 +237,19 @@ def process_child_kip(kip_id: int, child: dict):
 
 
 def get_kip_information(
-    kip_main_info: dict[str, Any],
+    kip_main_info: dict[str, Any] | None = None,
     chunk: int = 100,
     update: bool = False,
     overwrite_cache: bool = False,
     cache_filepath: str = "cache/kip_wiki_cache.json",
     timeout: int = 30,
+    workers: int = WIKI_DOWNLOAD_WORKERS,
 ) -> dict[int, dict[str, int | str]]:
     """Gets the details of all child pages of the KIP main page that relate
-    to a KIP. This takes a long time so will cache its results in a json file."""
+    to a KIP. This takes a long time so will cache its results in a json file.
+    If the KIP main page info is not supplied it is only fetched when the child
+    pages need to be downloaded. Up to `workers` pages of child pages are
+    downloaded at once."""
 
     if update and overwrite_cache:
         update = False
@@ -255,21 +272,34 @@ def get_kip_information(
     else:
         logger.info("Downloading KIP Wiki information for all KIPS")
 
-    for child in child_page_generator(kip_main_info, chunk, timeout):
-        kip_match: re.Match | None = re.search(KIP_PATTERN, child["title"])
-        if kip_match:
-            kip_id: int = int(kip_match.groupdict()["kip"])
-            if kip_id not in output:
-                output[kip_id] = process_child_kip(kip_id, child)
-            elif update:
-                cached_modified = output[kip_id].get("last_modified_on")
-                api_modified = child["history"]["lastUpdated"]["when"]
-                if cached_modified != api_modified:
-                    logger.info("KIP %s has been modified, refreshing", kip_id)
-                    output[kip_id] = process_child_kip(kip_id, child)
-
-    with open(cache_file_path, "w", encoding="utf8") as cache_file:
-        json.dump(output, cache_file)
+    if kip_main_info is None:
+        kip_main_info = get_kip_main_page_info(timeout=timeout)
+
+    # Parse the KIP pages in worker threads, so that parsing overlaps with the
+    # download of the next pages of results
+    pending: dict[int, Future] = {}
+    with ThreadPoolExecutor(max_workers=KIP_PROCESSING_WORKERS) as executor:
+        for child in child_page_generator(kip_main_info, chunk, timeout, workers):
+            kip_match: re.Match | None = KIP_PATTERN.search(child["title"])
+            if kip_match:
+                kip_id: int = int(kip_match.groupdict()["kip"])
+                if kip_id not in output and kip_id not in pending:
+                    pending[kip_id] = executor.submit(process_child_kip, kip_id, child)
+                elif update and kip_id in output:
+                    cached_modified = output[kip_id].get("last_modified_on")
+                    api_modified = child["history"]["lastUpdated"]["when"]
+                    if cached_modified != api_modified:
+                        logger.info("KIP %s has been modified, refreshing", kip_id)
+                        pending[kip_id] = executor.submit(
+                            process_child_kip, kip_id, child
+                        )
+
+    for kip_id, future in pending.items():
+        output[kip_id] = future.result()
+
+    # json.dumps encodes in one call to the C encoder, where json.dump streams
+    # through the pure Python one
+    write_text_atomic(cache_file_path, json.dumps(output))
 
     return output
 
@@ -284,7 +314,7 @@ def get_kip_tables(kip_main_info: dict[str, Any]) -> dict[str, Tag]:
         discarded, recordings] to the Table element."""
 
     body_html: str = get_kip_main_page_body(kip_main_info)
-    parsed_body: BeautifulSoup = BeautifulSoup(body_html, "html.parser")
+    parsed_body: BeautifulSoup = BeautifulSoup(body_html, "lxml")
 
     tables: list[Tag] = list(parsed_body.find_all("table"))
 
@@ -316,7 +346,7 @@ def process_discussion_table(
             continue
 
         kip_text: str = columns[0].a.text
-        kip_match: re.Match | None = re.search(KIP_PATTERN, kip_text)
+        kip_match: re.Match | None = KIP_PATTERN.search(kip_text)
 
         if kip_match:
             kip_id: int = int(kip_match.groupdict()["kip"])
@@ -0,0 +1,111 @@
+"""Tests for ipper.common.jira module."""
+
+import pytest
+from jira import JIRAError
+
+from ipper.common.jira import (
+    JiraStatus,
+    get_apache_jira_client,
+    get_apache_jira_status,
+    get_apache_jira_statuses,
+)
+
+
+@pytest.fixture
+def mock_jira(mocker):
+    """Patch the JIRA client and reset the lookup caches around each test."""
+    get_apache_jira_client.cache_clear()
+    get_apache_jira_status.cache_clear()
+    jira_class = mocker.patch("ipper.common.jira.JIRA")
+    yield jira_class.return_value
+    get_apache_jira_client.cache_clear()
+    get_apache_jira_status.cache_clear()
+
+
+def _make_issue(mocker, key: str, status: str):
+    """Build a mock JIRA issue with the given key and status name."""
+    issue = mocker.Mock()
+    issue.key = key
+    issue.fields.status.name = status
+    return issue
+
+
+class TestGetApacheJiraStatus:
+    """Tests for the get_apache_jira_status function."""
+
+    def test_returns_issue_status(self, mock_jira):
+        """Test the issue status name is mapped to a JiraStatus."""
+        mock_jira.issue.return_value.fields.status.name = "Resolved"
+
+        assert get_apache_jira_status("FLINK-1") == JiraStatus.RESOLVED
+
+    def test_repeated_lookup_is_cached(self, mock_jira):
+        """Test the same issue is only requested from the server once."""
+        mock_jira.issue.return_value.fields.status.name = "Open"
+
+        get_apache_jira_status("FLINK-2")
+        get_apache_jira_status("FLINK-2")
+        get_apache_jira_status("FLINK-3")
+
+        assert mock_jira.issue.call_count == 2
+
+    def test_jira_error_returns_unknown(self, mock_jira):
+        """Test a failed lookup returns the unknown status."""
+        mock_jira.issue.side_effect = JIRAError("not found")
+
+        assert get_apache_jira_status("FLINK-4") == JiraStatus.UNKNOWN
+
+
+class TestGetApacheJiraStatuses:
+    """Tests for the get_apache_jira_statuses function."""
+
+    def test_statuses_fetched_in_one_search(self, mock_jira, mocker):
+        """Test all issues are resolved by a single JQL search."""
+        mock_jira.search_issues.return_value = [
+            _make_issue(mocker, "FLINK-1", "Resolved"),
+            _make_issue(mocker, "FLINK-2", "In Progress"),
+        ]
+
+        result = get_apache_jira_statuses(["FLINK-2", "FLINK-1", "FLINK-1"])
+
+        assert result == {
+            "FLINK-1": JiraStatus.RESOLVED,
+            "FLINK-2": JiraStatus.IN_PROGRESS,
+        }
+        mock_jira.search_issues.assert_called_once()
+        assert (
+            mock_jira.search_issues.call_args.args[0]
+            == "issueKey in (FLINK-1, FLINK-2)"
+        )
+        mock_jira.issue.assert_not_called()
+
+    def test_issue_ids_are_chunked(self, mock_jira):
+        """Test one search is made per chunk of issue IDs."""
+        mock_jira.search_issues.return_value = []
+        mock_jira.issue.return_value.fields.status.name = "Open"
+
+        get_apache_jira_statuses([f"FLINK-{i}" for i in range(5)], chunk=2)
+
+        assert mock_jira.search_issues.call_count == 3
+
+    def test_missing_issue_falls_back_to_single_lookup(self, mock_jira, mocker):
+        """Test an issue not returned by the search is looked up individually."""
+        mock_jira.search_issues.return_value = [
+            _make_issue(mocker, "FLINK-1", "Closed")
+        ]
+        mock_jira.issue.return_value.fields.status.name = "Resolved"
+
+        result = get_apache_jira_statuses(["FLINK-1", "FLINK-9"])
+
+        assert result["FLINK-1"] == JiraStatus.CLOSED
+        assert result["FLINK-9"] == JiraStatus.RESOLVED
+        mock_jira.issue.assert_called_once_with("FLINK-9", fields="status")
+
+    def test_failed_search_falls_back_to_single_lookups(self, mock_jira):
+        """Test a failed search still returns a status for every issue."""
+        mock_jira.search_issues.side_effect = JIRAError("server error")
+        mock_jira.issue.return_value.fields.status.name = "Open"
+
+        result = get_apache_jira_statuses(["FLINK-1", "FLINK-2"])
+
+        assert result == {"FLINK-1": JiraStatus.OPEN, "FLINK-2": JiraStatus.OPEN}
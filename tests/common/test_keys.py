@@ -246,6 +246,22 @@ class TestCommitterIndex:
         assert result.name == "John Smith"
         assert score == 100.0
 
+    def test_fuzzy_name_match_word_order(self, sample_index):
+        """Test that a name with its words reordered is an exact match."""
+        result, score = sample_index.match_name_fuzzy("Smith  John")
+        assert result is not None
+        assert result.name == "John Smith"
+        assert score == 100.0
+
+    def test_fuzzy_name_match_exact_skips_scorer(self, sample_index, mocker):
+        """Test that an exact name match does not need the fuzzy scorer."""
+        extract_one = mocker.patch("ipper.common.keys.process.extractOne")
+        result, score = sample_index.match_name_fuzzy("Jane Doe")
+        assert result is not None
+        assert result.name == "Jane Doe"
+        assert score == 100.0
+        extract_one.assert_not_called()
+
     def test_fuzzy_name_match_with_typo(self, sample_index):
         """Test fuzzy name matching with minor typo."""
         result, score = sample_index.match_name_fuzzy("Jon Smith")
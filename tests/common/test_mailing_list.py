@@ -2,18 +2,39 @@
 
 import json
 import logging
+import mailbox
+import re
+from datetime import UTC, datetime
+from email.mime.text import MIMEText
+from pathlib import Path
 
 import pytest
+import requests
+from pandas import DataFrame, Series, Timestamp, concat, to_datetime
 
 from ipper.common.mailing_list import (
     _email_headers_match,
+    combine_mentions,
+    create_empty_mentions,
+    drop_duplicate_mentions,
     extract_message_payload,
+    get_monthly_mbox_file,
     get_months_to_download,
+    get_most_recent_mention_by_type,
+    get_most_recent_mentions,
+    get_multiple_mbox,
+    iter_mbox_messages,
+    load_mbox_cache_file,
     load_metadata,
+    merge_mentions,
+    normalise_votes,
     parse_for_vote,
     parse_message_timestamp,
+    process_all_mbox_in_directory,
+    process_mbox_archive,
+    process_mbox_files,
+    save_mbox_cache_file,
     save_metadata,
-    vote_converter,
 )
 
 
@@ -59,6 +80,16 @@ class TestParseMessageTimestamp:
         assert result.year == 2026
         assert result.month == 2
 
+    def test_unknown_zone_is_utc(self):
+        """Test a "-0000" (unknown) zone gives a UTC time rather than a naive one."""
+        result = parse_message_timestamp("Fri, 07 Feb 2026 12:00:00 -0000")
+
+        assert result == datetime(2026, 2, 7, 12, tzinfo=UTC)
+
+    def test_missing_header_returns_none(self):
+        """Test that a missing Date header returns None."""
+        assert parse_message_timestamp(None) is None  # type: ignore[arg-type]
+
     def test_invalid_format_returns_none(self):
         """Test that invalid date format returns None."""
         date_str = "This is not a valid date"
@@ -396,39 +427,490 @@ Omnia"""
             result = parse_for_vote(payload, "voter@example.com")
             assert result == expected, f"Backward compatibility failed for: {payload}"
 
+    def test_unclosed_parentheses_after_marker(self):
+        """Test that unclosed parentheses after the marker do not hide the vote."""
+        payloads = [
+            "+1 (binding) " + "(" * 10000,
+            "+1 binding (see (the notes",
+            "+1 (non-binding) " + "(" * 10000,
+        ]
+        expected_results = ["+1", "+1", None]
 
-class TestVoteConverter:
-    """Tests for the vote_converter function."""
+        for payload, expected in zip(payloads, expected_results, strict=True):
+            result = parse_for_vote(payload, "voter@example.com")
+            assert result == expected, f"Failed for: {payload[:30]}"
+
+
+class TestNormaliseVotes:
+    """Tests for the normalise_votes function."""
 
     def test_convert_positive_vote(self):
-        """Test converting +1 vote."""
-        result = vote_converter("1.0")
-        assert result == "+1"
+        """Test converting +1 votes."""
+        assert normalise_votes(Series(["1.0", "+1", "2"])).tolist() == ["+1"] * 3
 
     def test_convert_negative_vote(self):
         """Test converting -1 vote."""
-        result = vote_converter("-1.0")
-        assert result == "-1"
+        assert normalise_votes(Series(["-1.0"])).tolist() == ["-1"]
 
     def test_convert_zero_vote(self):
-        """Test converting 0 vote."""
-        result = vote_converter("0.0")
-        assert result == "0"
+        """Test converting 0 votes."""
+        assert normalise_votes(Series(["0.0", "0.5", "-0.5"])).tolist() == ["0"] * 3
 
-    def test_empty_string_returns_none(self):
-        """Test that empty string returns None."""
-        result = vote_converter("")
-        assert result is None
+    def test_missing_vote_returns_none(self):
+        """Test that missing votes are None."""
+        assert normalise_votes(Series([None, float("nan")])).tolist() == [None, None]
 
-    def test_none_input_returns_none(self):
-        """Test that None input returns None."""
-        result = vote_converter(None)
-        assert result is None
+    def test_non_numeric_string_returns_none(self, caplog):
+        """Test that a non-numeric string returns None instead of crashing."""
+        with caplog.at_level(logging.WARNING):
+            result = normalise_votes(Series(["not_a_number", "1"]))
 
-    def test_non_numeric_string_returns_none(self):
-        """Test that non-numeric string returns None instead of crashing."""
-        result = vote_converter("not_a_number")
-        assert result is None
+        assert result.tolist() == [None, "+1"]
+        assert "Could not convert 1 vote value(s)" in caplog.text
+
+    def test_index_is_kept(self):
+        """Test the result is aligned with the supplied votes."""
+        votes = Series(["1", "-1"], index=[5, 3], name="vote")
+
+        result = normalise_votes(votes)
+
+        assert result.index.tolist() == [5, 3]
+        assert result.name == "vote"
+
+
+def _process_fake_mbox(mbox_file: Path) -> DataFrame:
+    """Module level (and so picklable) stand-in for an mbox processing function."""
+    if mbox_file.stem == "bad":
+        raise ValueError("corrupt mbox")
+    return DataFrame({"file": [mbox_file.name]})
+
+
+class TestIterMboxMessages:
+    """Tests for the iter_mbox_messages function."""
+
+    def _write_mbox(self, path: Path) -> None:
+        archive = mailbox.mbox(path)
+        for number, body in enumerate(
+            ["+1 (binding)\n", "From the start\nKIP-1\n", "No trailing newline"]
+        ):
+            archive.add(f"Subject: [VOTE] KIP-{number}\n\n{body}")
+        archive.close()
+
+    def test_messages_match_mailbox(self, tmp_path):
+        """Test the streamed messages match those read by mailbox.mbox."""
+        mbox_path = tmp_path / "dev_kafka_apache_org-2025-1.mbox"
+        self._write_mbox(mbox_path)
+
+        expected = [msg.as_bytes() for msg in mailbox.mbox(mbox_path)]
+        result = [msg.as_bytes() for msg in iter_mbox_messages(mbox_path)]
+
+        assert len(result) == 3
+        assert result == expected
+
+    def test_empty_archive(self, tmp_path):
+        """Test an empty archive yields no messages."""
+        mbox_path = tmp_path / "empty.mbox"
+        mbox_path.write_bytes(b"")
+
+        assert list(iter_mbox_messages(mbox_path)) == []
+
+    def test_from_only_split_at_line_start(self, tmp_path):
+        """Test text before the first "From " line and mid-line "From " is kept."""
+        mbox_path = tmp_path / "split.mbox"
+        mbox_path.write_bytes(
+            b"preamble\nFrom a\nSubject: x\n\nsent From here\n\nFrom b\n\nlast"
+        )
+
+        expected = [msg.as_bytes() for msg in mailbox.mbox(mbox_path)]
+        result = [msg.as_bytes() for msg in iter_mbox_messages(mbox_path)]
+
+        assert len(result) == 2
+        assert result == expected
+
+
+class TestProcessMboxArchive:
+    """Tests for the process_mbox_archive function."""
+
+    COLUMNS = [
+        "kip",
+        "mention_type",
+        "message_id",
+        "mbox_year",
+        "mbox_month",
+        "timestamp",
+        "from",
+        "vote",
+    ]
+
+    def test_mention_prefix_does_not_change_mentions(self, tmp_path):
+        """Test skipping bodies without the mention prefix finds the same mentions."""
+        mbox_path = tmp_path / "dev_kafka_apache_org-2025-3.mbox"
+        archive = mailbox.mbox(mbox_path)
+        for number, body in enumerate(
+            ["See kip-12 and KIP-13 for details", "Nothing to see here", "No KIPs"]
+        ):
+            archive.add(
+                f"Subject: Question {number}\n"
+                "From: Alice <alice@example.com>\n"
+                "Date: Mon, 03 Mar 2025 10:00:00 +0000\n\n"
+                f"{body}\n"
+            )
+        archive.close()
+
+        pattern = re.compile(r"KIP-(?P<kip>\d+)", re.IGNORECASE)
+        expected = process_mbox_archive(mbox_path, pattern, "kip", self.COLUMNS)
+        result = process_mbox_archive(
+            mbox_path, pattern, "kip", self.COLUMNS, mention_prefix="kip-"
+        )
+
+        assert result["kip"].tolist() == [12, 13]
+        assert result.equals(expected)
+
+    def test_repeated_mentions_in_a_message_added_once(self, tmp_path):
+        """Test a proposal mentioned repeatedly in one message gives one row."""
+        mbox_path = tmp_path / "dev_kafka_apache_org-2025-3.mbox"
+        archive = mailbox.mbox(mbox_path)
+        for number in range(2):
+            archive.add(
+                "Subject: [DISCUSS] KIP-5 Example\n"
+                "From: Alice <alice@example.com>\n"
+                f"Date: Mon, 0{number + 1} Mar 2025 10:00:00 +0000\n\n"
+                "KIP-5 is great, I like KIP-5 and KIP-6\n"
+            )
+        archive.close()
+
+        pattern = re.compile(r"KIP-(?P<kip>\d+)", re.IGNORECASE)
+        result = process_mbox_archive(mbox_path, pattern, "kip", self.COLUMNS)
+
+        mentions = list(
+            zip(
+                result["message_id"], result["kip"], result["mention_type"], strict=True
+            )
+        )
+        assert mentions == [
+            (0, 5, "subject"),
+            (0, 5, "discuss"),
+            (0, 5, "body"),
+            (0, 6, "body"),
+            (1, 5, "subject"),
+            (1, 5, "discuss"),
+            (1, 5, "body"),
+            (1, 6, "body"),
+        ]
+
+    def test_message_without_subject(self, tmp_path):
+        """Test a message without a subject still has its body mentions found."""
+        mbox_path = tmp_path / "dev_kafka_apache_org-2025-3.mbox"
+        archive = mailbox.mbox(mbox_path)
+        archive.add(
+            "From: Alice <alice@example.com>\n"
+            "Date: Mon, 03 Mar 2025 10:00:00 +0000\n\n"
+            "See KIP-7\n"
+        )
+        archive.close()
+
+        pattern = re.compile(r"KIP-(?P<kip>\d+)", re.IGNORECASE)
+        result = process_mbox_archive(mbox_path, pattern, "kip", self.COLUMNS)
+
+        assert result["kip"].tolist() == [7]
+        assert result["mention_type"].tolist() == ["body"]
+
+    def test_mention_prefix_keeps_encoded_mentions(self, tmp_path):
+        """Test mentions in encoded or non-ASCII bodies are still found."""
+        mbox_path = tmp_path / "dev_kafka_apache_org-2025-3.mbox"
+        archive = mailbox.mbox(mbox_path)
+        for number, body in enumerate(["See KIP-21", "See KİP-22", "See nothing"]):
+            message = MIMEText(body, "plain", "utf-8")
+            message["Subject"] = f"Question {number}"
+            message["Date"] = "Mon, 03 Mar 2025 10:00:00 +0000"
+            archive.add(message)
+        archive.close()
+
+        pattern = re.compile(r"KIP-(?P<kip>\d+)", re.IGNORECASE)
+        result = process_mbox_archive(
+            mbox_path, pattern, "kip", self.COLUMNS, mention_prefix="kip-"
+        )
+
+        assert result["kip"].tolist() == [21, 22]
+
+
+class TestProcessMboxFiles:
+    """Tests for the process_mbox_files function."""
+
+    FILES = [Path("2025-01.mbox"), Path("bad.mbox"), Path("2025-02.mbox")]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_results_keep_file_order(self, max_workers):
+        """Test frames are returned in file order whether or not a pool is used."""
+        frames, _ = process_mbox_files(self.FILES, _process_fake_mbox, max_workers)
+
+        assert [frame["file"][0] for frame in frames] == [
+            "2025-01.mbox",
+            "2025-02.mbox",
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_failed_files_are_reported(self, max_workers):
+        """Test a failing file is skipped and reported as an error."""
+        _, errors = process_mbox_files(self.FILES, _process_fake_mbox, max_workers)
+
+        assert len(errors) == 1
+        assert "bad.mbox" in errors[0]
+
+    def test_no_files(self):
+        """Test an empty file list returns no frames or errors."""
+        assert process_mbox_files([], _process_fake_mbox) == ([], [])
+
+
+class TestProcessAllMboxInDirectory:
+    """Tests for the process_all_mbox_in_directory function."""
+
+    def test_mentions_combined_from_all_files(self, tmp_path):
+        """Test the mentions from every mbox file are combined in file order."""
+        for name in ["2025-02.mbox", "bad.mbox", "2025-01.mbox", "notes.txt"]:
+            (tmp_path / name).write_text("")
+
+        mentions, errors = process_all_mbox_in_directory(
+            tmp_path, _process_fake_mbox, ["file"], max_workers=1
+        )
+
+        assert mentions["file"].tolist() == ["2025-01.mbox", "2025-02.mbox"]
+        assert len(errors) == 1
+
+    def test_empty_directory(self, tmp_path):
+        """Test an empty directory gives an empty frame with the mention columns."""
+        mentions, errors = process_all_mbox_in_directory(
+            tmp_path, _process_fake_mbox, ["flip", "timestamp"]
+        )
+
+        assert mentions.empty
+        assert list(mentions.columns) == ["flip", "timestamp"]
+        assert errors == []
+
+
+class TestLoadMboxCacheFile:
+    """Tests for the load_mbox_cache_file function."""
+
+    CSV_CONTENT = (
+        "flip,mention_type,message_id,mbox_year,mbox_month,timestamp,from,vote\n"
+        "1,vote,3,2025,1,2025-01-13 01:57:03+00:00,Alice,1.0\n"
+        "1,subject,4,2025,1,2025-01-14 01:57:03+00:00,Bob,\n"
+    )
+
+    def test_loads_all_columns_with_converters(self, tmp_path):
+        """Test that votes and timestamps are converted on load."""
+        cache_file = tmp_path / "mentions.csv"
+        cache_file.write_text(self.CSV_CONTENT)
+
+        result = load_mbox_cache_file(cache_file)
+
+        assert len(result.columns) == 8
+        assert result["vote"].tolist() == ["+1", None]
+        assert str(result["timestamp"].dt.tz) == "UTC"
+
+    def test_usecols_loads_subset(self, tmp_path):
+        """Test that only the requested columns are loaded."""
+        cache_file = tmp_path / "mentions.csv"
+        cache_file.write_text(self.CSV_CONTENT)
+
+        result = load_mbox_cache_file(
+            cache_file, usecols=["flip", "from", "vote", "timestamp"]
+        )
+
+        assert sorted(result.columns) == ["flip", "from", "timestamp", "vote"]
+        assert result["vote"].tolist() == ["+1", None]
+        assert str(result["timestamp"].dt.tz) == "UTC"
+
+    def test_column_types(self, tmp_path):
+        """Test that the loaded columns have the processed mention types."""
+        cache_file = tmp_path / "mentions.csv"
+        cache_file.write_text(self.CSV_CONTENT)
+
+        result = load_mbox_cache_file(cache_file)
+
+        assert str(result["message_id"].dtype) == "int64"
+        assert str(result["mbox_month"].dtype) == "int64"
+        assert str(result["timestamp"].dtype) == "datetime64[ns, UTC]"
+        assert result["timestamp"].iloc[0] == Timestamp("2025-01-13 01:57:03+00:00")
+
+
+class TestSaveMboxCacheFile:
+    """Tests for the save_mbox_cache_file function."""
+
+    def _mentions(self, timestamps: list[str | None]) -> DataFrame:
+        mentions = DataFrame(
+            {
+                "kip": range(len(timestamps)),
+                "timestamp": to_datetime(timestamps, utc=True),
+                "vote": "+1",
+            }
+        )
+        return mentions
+
+    @pytest.mark.parametrize(
+        "timestamps",
+        [
+            ["2025-01-13 01:57:03", "2015-12-31 23:59:59"],
+            ["2025-01-13 01:57:03", None],
+            ["2025-01-13 01:57:03.250", "2015-12-31 23:59:59.000"],
+        ],
+    )
+    def test_output_matches_pandas(self, tmp_path, timestamps):
+        """Test the written file is identical to a plain pandas to_csv."""
+        mentions = self._mentions(timestamps)
+        cache_file = tmp_path / "mentions.csv"
+
+        save_mbox_cache_file(mentions, cache_file)
+
+        assert cache_file.read_text() == mentions.to_csv(index=False)
+
+    def test_round_trip(self, tmp_path):
+        """Test a saved cache file loads back with the same timestamps."""
+        mentions = self._mentions(["2025-01-13 01:57:03"])
+        cache_file = tmp_path / "mentions.csv"
+
+        save_mbox_cache_file(mentions, cache_file)
+        result = load_mbox_cache_file(cache_file)
+
+        assert result["timestamp"].equals(mentions["timestamp"])
+        assert (
+            cache_file.read_text().splitlines()[1] == "0,2025-01-13 01:57:03+00:00,+1"
+        )
+
+    def test_empty_mentions(self, tmp_path):
+        """Test an empty mentions frame without parsed timestamps can be saved."""
+        cache_file = tmp_path / "mentions.csv"
+
+        save_mbox_cache_file(DataFrame(columns=["kip", "timestamp"]), cache_file)
+
+        assert cache_file.read_text() == "kip,timestamp\n"
+
+    def test_failed_write_keeps_previous_cache(self, tmp_path, mocker):
+        """Test a write that fails part way leaves the previous cache in place."""
+        cache_file = tmp_path / "mentions.csv"
+        cache_file.write_text("previous")
+        mocker.patch.object(DataFrame, "to_csv", side_effect=OSError("disk full"))
+
+        with pytest.raises(OSError):
+            save_mbox_cache_file(self._mentions(["2025-01-13 01:57:03"]), cache_file)
+
+        assert cache_file.read_text() == "previous"
+
+    def test_no_temporary_file_left(self, tmp_path):
+        """Test only the cache file remains after saving."""
+        cache_file = tmp_path / "mentions.csv"
+
+        save_mbox_cache_file(self._mentions(["2025-01-13 01:57:03"]), cache_file)
+
+        assert [path.name for path in tmp_path.iterdir()] == ["mentions.csv"]
+
+
+class TestCreateEmptyMentions:
+    """Tests for create_empty_mentions()."""
+
+    COLUMNS = [
+        "kip",
+        "mention_type",
+        "message_id",
+        "mbox_year",
+        "mbox_month",
+        "timestamp",
+        "from",
+        "vote",
+    ]
+
+    def test_columns_are_typed(self):
+        """The empty frame has the column types of processed mentions."""
+        empty = create_empty_mentions(self.COLUMNS)
+
+        assert list(empty.columns) == self.COLUMNS
+        assert empty.empty
+        assert str(empty["kip"].dtype) == "int64"
+        assert str(empty["mbox_month"].dtype) == "int64"
+        assert str(empty["timestamp"].dtype) == "datetime64[ns, UTC]"
+
+    def test_concat_keeps_types(self):
+        """Combining with processed mentions does not upcast to object columns."""
+        mentions = DataFrame(
+            {
+                "kip": [1],
+                "mention_type": ["vote"],
+                "message_id": [3],
+                "mbox_year": [2025],
+                "mbox_month": [1],
+                "timestamp": to_datetime(["2025-01-01 10:00:00"], utc=True),
+                "from": ["Alice"],
+                "vote": ["+1"],
+            }
+        )
+
+        result = concat([create_empty_mentions(self.COLUMNS), mentions])
+
+        assert (result.dtypes == mentions.dtypes).all()
+
+
+class TestCombineMentions:
+    """Tests for combine_mentions()."""
+
+    COLUMNS = TestCreateEmptyMentions.COLUMNS
+
+    def _mentions(self, kip: int) -> DataFrame:
+        return DataFrame(
+            {
+                "kip": [kip],
+                "mention_type": ["body"],
+                "message_id": [0],
+                "mbox_year": [2025],
+                "mbox_month": [kip],
+                "timestamp": to_datetime(["2025-01-01 10:00:00"], utc=True),
+                "from": ["Alice"],
+                "vote": [None],
+            }
+        )
+
+    def test_no_frames_gives_typed_empty_frame(self):
+        """No processed files gives the typed empty mentions frame."""
+        result = combine_mentions([], self.COLUMNS)
+
+        assert result.empty
+        assert str(result["timestamp"].dtype) == "datetime64[ns, UTC]"
+
+    def test_single_frame_returned_as_is(self):
+        """A single frame is not copied."""
+        mentions = self._mentions(1)
+
+        assert combine_mentions([mentions], self.COLUMNS) is mentions
+
+    def test_frames_combined_in_order(self):
+        """Several frames are combined in order with a fresh index."""
+        result = combine_mentions([self._mentions(1), self._mentions(2)], self.COLUMNS)
+
+        assert result["kip"].tolist() == [1, 2]
+        assert result.index.tolist() == [0, 1]
+
+
+class TestDropDuplicateMentions:
+    """Tests for drop_duplicate_mentions()."""
+
+    def test_repeated_mention_dropped(self):
+        """A mention repeated by another file of the same month is kept once."""
+        mentions = TestCombineMentions()._mentions(1)
+        repeated = concat([mentions, mentions, TestCombineMentions()._mentions(2)])
+
+        result = drop_duplicate_mentions(repeated)
+
+        assert result["kip"].tolist() == [1, 2]
+
+    def test_same_message_id_from_another_list_kept(self):
+        """Mentions sharing a message_id from another list's archive are kept."""
+        dev_mention = TestCombineMentions()._mentions(1)
+        user_mention = dev_mention.assign(
+            timestamp=to_datetime(["2025-01-02 09:00:00"], utc=True), **{"from": "Bob"}
+        )
+
+        result = drop_duplicate_mentions(concat([dev_mention, user_mention]))
+
+        assert result["from"].tolist() == ["Alice", "Bob"]
 
 
 class TestMetadataFunctions:
@@ -477,6 +959,94 @@ class TestMetadataFunctions:
         assert result is None
 
 
+class TestGetMonthlyMboxFile:
+    """Tests for the get_monthly_mbox_file function."""
+
+    def test_response_body_written_to_file(self, tmp_path, mocker):
+        """Test the downloaded archive is written to the named mbox file."""
+        response = mocker.MagicMock()
+        response.iter_content.return_value = [
+            b"From a@b Mon Jan  1 00:00:00 2025\n",
+            b"\nHello\n",
+        ]
+        session = mocker.patch("ipper.common.mailing_list._get_mbox_session")
+        session.return_value.get.return_value.__enter__.return_value = response
+
+        result = get_monthly_mbox_file(
+            "dev", "kafka.apache.org", 2025, 1, output_directory=str(tmp_path)
+        )
+
+        assert result == tmp_path / "dev_kafka_apache_org-2025-1.mbox"
+        assert result.read_bytes().endswith(b"Hello\n")
+        response.raise_for_status.assert_called_once()
+
+    def test_interrupted_download_removed(self, tmp_path, mocker):
+        """Test a partly written archive is removed when the download fails."""
+
+        def body(chunk_size):
+            yield b"From a@b Mon Jan  1 00:00:00 2025\n"
+            raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+        response = mocker.MagicMock()
+        response.iter_content.side_effect = body
+        session = mocker.patch("ipper.common.mailing_list._get_mbox_session")
+        session.return_value.get.return_value.__enter__.return_value = response
+
+        with pytest.raises(requests.RequestException):
+            get_monthly_mbox_file(
+                "dev", "kafka.apache.org", 2025, 1, output_directory=str(tmp_path)
+            )
+
+        assert not (tmp_path / "dev_kafka_apache_org-2025-1.mbox").exists()
+
+    def test_existing_file_not_downloaded(self, tmp_path, mocker):
+        """Test an existing archive is kept unless overwrite is set."""
+        existing = tmp_path / "dev_kafka_apache_org-2025-1.mbox"
+        existing.write_bytes(b"cached")
+        session = mocker.patch("ipper.common.mailing_list._get_mbox_session")
+
+        get_monthly_mbox_file(
+            "dev", "kafka.apache.org", 2025, 1, output_directory=str(tmp_path)
+        )
+
+        session.assert_not_called()
+        assert existing.read_bytes() == b"cached"
+
+
+class TestGetMultipleMbox:
+    """Tests for the get_multiple_mbox function."""
+
+    def test_downloads_in_month_order_skipping_failures(self, tmp_path, mocker):
+        """Test files are returned in month order and failed months are skipped."""
+        mocker.patch(
+            "ipper.common.mailing_list.get_months_to_download",
+            return_value=[(2025, 11), (2025, 12), (2026, 1)],
+        )
+
+        def download(mailing_list, domain, year, month, **kwargs) -> Path:
+            if (year, month) == (2026, 1):
+                raise requests.ConnectionError("timed out")
+            return Path(f"{year}-{month}.mbox")
+
+        mocker.patch(
+            "ipper.common.mailing_list.get_monthly_mbox_file", side_effect=download
+        )
+
+        result = get_multiple_mbox(
+            "dev",
+            "kafka.apache.org",
+            "metadata.json",
+            output_directory=str(tmp_path / "mbox"),
+            use_metadata=True,
+        )
+
+        assert result == [Path("2025-11.mbox"), Path("2025-12.mbox")]
+        metadata = load_metadata(tmp_path / "metadata.json")
+        assert metadata is not None
+        assert metadata["latest_mbox_year"] == 2025
+        assert metadata["latest_mbox_month"] == 12
+
+
 class TestGetMonthsToDownload:
     """Tests for the get_months_to_download function."""
 
@@ -1151,3 +1721,149 @@ class TestUrlStripping:
             payload, "Alice Johnson <alice@apache.org>", sample_committer_index
         )
         assert result is None, "Multiple URLs with 0s should not produce false votes"
+
+
+def _make_mentions(rows: list[tuple[int, str, str]]) -> DataFrame:
+    """Build a mentions DataFrame from (kip, mention_type, timestamp) tuples."""
+    mentions = DataFrame(rows, columns=["kip", "mention_type", "timestamp"])
+    mentions["timestamp"] = to_datetime(mentions["timestamp"], utc=True)
+    return mentions
+
+
+class TestGetMostRecentMentions:
+    """Tests for the get_most_recent_mentions function."""
+
+    def test_latest_mention_per_type_selected(self):
+        """Test only the latest mention of each type for each proposal is kept."""
+        mentions = _make_mentions(
+            [
+                (1, "vote", "2025-01-03 10:00"),
+                (1, "vote", "2025-01-05 10:00"),
+                (1, "discuss", "2025-01-01 10:00"),
+                (2, "vote", "2025-02-01 10:00"),
+                (1, "vote", "2025-01-04 10:00"),
+            ]
+        )
+
+        result = get_most_recent_mentions(mentions, "kip")
+
+        latest = {
+            (row.kip, row.mention_type): row.timestamp for row in result.itertuples()
+        }
+        assert len(result) == 3
+        assert latest[(1, "vote")] == Timestamp("2025-01-05 10:00", tz="UTC")
+        assert latest[(1, "discuss")] == Timestamp("2025-01-01 10:00", tz="UTC")
+        assert latest[(2, "vote")] == Timestamp("2025-02-01 10:00", tz="UTC")
+
+    def test_missing_timestamp_not_selected(self):
+        """Test a mention without a timestamp does not hide a dated mention."""
+        mentions = _make_mentions([(1, "vote", "2025-01-05 10:00"), (1, "vote", None)])
+
+        result = get_most_recent_mentions(mentions, "kip")
+
+        assert result["timestamp"].tolist() == [Timestamp("2025-01-05 10:00", tz="UTC")]
+
+
+class TestGetMostRecentMentionByType:
+    """Tests for the get_most_recent_mention_by_type function."""
+
+    def test_pivot_with_overall_column(self):
+        """Test mention types become columns and overall is the latest of any."""
+        mentions = _make_mentions(
+            [
+                (1, "vote", "2025-01-05 10:00"),
+                (1, "discuss", "2025-01-07 10:00"),
+                (2, "vote", "2025-02-01 10:00"),
+            ]
+        )
+
+        result = get_most_recent_mention_by_type(mentions, "kip")
+
+        assert result.loc[1, "vote"] == Timestamp("2025-01-05 10:00", tz="UTC")
+        assert result.loc[1, "overall"] == Timestamp("2025-01-07 10:00", tz="UTC")
+        assert result.loc[2, "overall"] == Timestamp("2025-02-01 10:00", tz="UTC")
+
+
+def _month_mentions(month: int, senders: list[str]) -> DataFrame:
+    """Build mentions of KIP-1 from the senders' messages of a 2025 mbox month.
+
+    Each message's id is its position in the list, as in a downloaded mbox.
+    """
+    return DataFrame(
+        {
+            "kip": 1,
+            "mention_type": "body",
+            "message_id": range(len(senders)),
+            "mbox_year": 2025,
+            "mbox_month": month,
+            "from": senders,
+        }
+    )
+
+
+class TestMergeMentions:
+    """Tests for the merge_mentions function."""
+
+    def test_reprocessed_month_replaced(self):
+        """Test a re-processed month's mentions replace the cached ones."""
+        existing = concat(
+            [_month_mentions(1, ["Alice", "Bob"]), _month_mentions(2, ["Alice", "Bob"])]
+        )
+        # The February mbox was re-downloaded with an extra message, shifting the ids
+        new = [_month_mentions(2, ["Carol", "Alice", "Bob"])]
+
+        result = merge_mentions(existing, new)
+
+        january = result[result["mbox_month"] == 1]
+        february = result[result["mbox_month"] == 2]
+        assert january["message_id"].tolist() == [0, 1]
+        assert february["from"].tolist() == ["Carol", "Alice", "Bob"]
+        assert february["message_id"].tolist() == [0, 1, 2]
+
+    def test_new_month_appended(self):
+        """Test mentions from a month not in the cache are appended."""
+        existing = _month_mentions(1, ["Alice"])
+
+        result = merge_mentions(existing, [_month_mentions(2, ["Alice"])])
+
+        assert result["mbox_month"].tolist() == [1, 2]
+
+    def test_no_new_mentions(self):
+        """Test the existing mentions are returned when nothing was processed."""
+        existing = _month_mentions(1, ["Alice", "Bob"])
+
+        assert merge_mentions(existing, []) is existing
+
+    def test_month_processed_twice_added_once(self):
+        """Test a month processed twice in one batch is only added once."""
+        existing = _month_mentions(1, ["Alice"])
+        new = [
+            _month_mentions(2, ["Alice", "Bob"]),
+            _month_mentions(2, ["Alice", "Bob", "Carol"]),
+        ]
+
+        result = merge_mentions(existing, new)
+
+        february = result[result["mbox_month"] == 2]
+        assert february["from"].tolist() == ["Alice", "Bob", "Carol"]
+
+    def test_other_lists_in_batch_kept(self):
+        """Test the same month from two lists in one batch keeps both lists."""
+        existing = _month_mentions(1, ["Alice"])
+        # The dev and user archives both number their first message 0
+        new = [_month_mentions(2, ["Alice"]), _month_mentions(2, ["Bob"])]
+
+        result = merge_mentions(existing, new)
+
+        assert result[result["mbox_month"] == 2]["from"].tolist() == ["Alice", "Bob"]
+
+    def test_other_lists_in_cache_kept(self):
+        """Test re-processing one list's month keeps another list's cached mentions."""
+        # February's dev and user archives were both processed previously
+        existing = concat([_month_mentions(2, ["Alice"]), _month_mentions(2, ["Bob"])])
+        # Only the dev archive was re-downloaded
+        new = [_month_mentions(2, ["Alice", "Carol"])]
+
+        result = merge_mentions(existing, new)
+
+        assert sorted(result["from"]) == ["Alice", "Bob", "Carol"]
@@ -1,10 +1,22 @@
 """Tests for ipper.common.utils module."""
 
 import datetime as dt
+import os
 
+import pytest
 from freezegun import freeze_time
 
-from ipper.common.utils import calculate_age, generate_month_list
+from ipper.common.utils import (
+    calculate_age,
+    current_date_string,
+    format_age,
+    generate_month_list,
+    get_template,
+    write_text_atomic,
+)
+
+# The current time used by the clock-dependent tests
+FROZEN_NOW = dt.datetime(2026, 2, 7, 12, 0, 0, tzinfo=dt.UTC)
 
 
 class TestGenerateMonthList:
@@ -94,163 +106,242 @@ class TestGenerateMonthList:
         result = generate_month_list(now, then)
         assert result == [(2025, 12), (2026, 1)]
 
+    def test_then_after_now(self):
+        """Test that a start month after now is still returned on its own."""
+        now = dt.datetime(2026, 1, 15, tzinfo=dt.UTC)
+        then = dt.datetime(2026, 3, 1, tzinfo=dt.UTC)
+        result = generate_month_list(now, then)
+        assert result == [(2026, 3)]
+
 
 class TestCalculateAge:
     """Tests for the calculate_age function."""
 
     def test_days_format_less_than_week(self):
         """Test age formatting for dates less than 7 days old."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # 5 days ago
-            date_str = "2026-02-02T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "5 days"
+        # 5 days ago
+        date_str = "2026-02-02T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "5 days"
 
     def test_weeks_format(self):
         """Test age formatting for dates between 7 and 364 days."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # 8 weeks ago (Dec 13 to Feb 7 = 1 month, 25 days = 1 month and 3 weeks)
-            date_str = "2025-12-13T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "1 month and 3 weeks"
+        # 8 weeks ago (Dec 13 to Feb 7 = 1 month, 25 days = 1 month and 3 weeks)
+        date_str = "2025-12-13T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "1 month and 3 weeks"
 
     def test_years_format(self):
         """Test age formatting for dates 365+ days old."""
+        # 1 year and 1 month ago (Jan 1, 2025 to Feb 7, 2026)
+        date_str = "2025-01-01T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
 
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # 1 year and 1 month ago (Jan 1, 2025 to Feb 7, 2026)
-            date_str = "2025-01-01T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-
-            # Should include years and months
-            assert "year" in result
-            assert "month" in result
-            assert result == "1 year and 1 month"
+        # Should include years and months
+        assert "year" in result
+        assert "month" in result
+        assert result == "1 year and 1 month"
 
     def test_exact_week(self):
         """Test age formatting for exactly 7 days."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # Exactly 7 days ago
-            date_str = "2026-01-31T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            # 7 days should show as "1 week"
-            assert result == "1 week"
+        # Exactly 7 days ago
+        date_str = "2026-01-31T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        # 7 days should show as "1 week"
+        assert result == "1 week"
 
     def test_single_day(self):
         """Test age formatting for exactly 1 day."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            date_str = "2026-02-06T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "1 day"
+        date_str = "2026-02-06T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "1 day"
 
     def test_multiple_days_less_than_week(self):
         """Test age formatting for multiple days less than a week."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            date_str = "2026-02-03T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "4 days"
+        date_str = "2026-02-03T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "4 days"
 
     def test_single_month(self):
         """Test age formatting for exactly 1 month."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # 1 month ago (Jan 7 to Feb 7)
-            date_str = "2026-01-07T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "1 month"
+        # 1 month ago (Jan 7 to Feb 7)
+        date_str = "2026-01-07T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "1 month"
 
     def test_months_and_weeks(self):
         """Test age formatting with months and weeks."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # 2 months and 2 weeks ago (Nov 24, 2025 to Feb 7, 2026)
-            date_str = "2025-11-24T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "2 months and 2 weeks"
+        # 2 months and 2 weeks ago (Nov 24, 2025 to Feb 7, 2026)
+        date_str = "2025-11-24T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "2 months and 2 weeks"
 
     def test_year_without_months_or_weeks(self):
         """Test age formatting for exactly 1 year."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # Exactly 1 year ago
-            date_str = "2025-02-07T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "1 year"
+        # Exactly 1 year ago
+        date_str = "2025-02-07T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "1 year"
 
     def test_years_and_months_no_weeks(self):
         """Test age formatting with years and months but no weeks."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # 2 years and 3 months ago (Nov 7, 2023 to Feb 7, 2026)
-            date_str = "2023-11-07T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "2 years and 3 months"
+        # 2 years and 3 months ago (Nov 7, 2023 to Feb 7, 2026)
+        date_str = "2023-11-07T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "2 years and 3 months"
 
     def test_years_and_weeks_no_months(self):
         """Test age formatting with years and weeks but no months."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # 3 years and 2 weeks ago (Jan 24, 2023 to Feb 7, 2026)
-            date_str = "2023-01-24T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "3 years and 2 weeks"
+        # 3 years and 2 weeks ago (Jan 24, 2023 to Feb 7, 2026)
+        date_str = "2023-01-24T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "3 years and 2 weeks"
 
     def test_years_months_and_weeks(self):
         """Test age formatting with all three components."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # 3 years, 3 months, and 2 weeks ago (Oct 24, 2022 to Feb 7, 2026)
-            date_str = "2022-10-24T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "3 years, 3 months and 2 weeks"
+        # 3 years, 3 months, and 2 weeks ago (Oct 24, 2022 to Feb 7, 2026)
+        date_str = "2022-10-24T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "3 years, 3 months and 2 weeks"
 
     def test_month_boundary_31_days(self):
         """Test age calculation across month boundary with 31-day month."""
-
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # Jan 31 to Feb 7 = 0 months, 7 days = 1 week
-            date_str = "2026-01-31T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "1 week"
+        # Jan 31 to Feb 7 = 0 months, 7 days = 1 week
+        date_str = "2026-01-31T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+        assert result == "1 week"
 
     def test_leap_year_edge_case(self):
         """Test age calculation over leap year February."""
+        # Feb 1 to Mar 1 in leap year = 1 month
+        now = dt.datetime(2024, 3, 1, 12, 0, 0, tzinfo=dt.UTC)
+        date_str = "2024-02-01T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, now)
+        assert result == "1 month"
+
+    def test_defaults_to_current_time(self):
+        """Test the current time is used when no reference time is given."""
+        with freeze_time(FROZEN_NOW):
+            result = calculate_age("2026-02-02T12:00:00Z", "%Y-%m-%dT%H:%M:%SZ")
 
-        with freeze_time("2024-03-01 12:00:00+00:00"):
-            # Feb 1 to Mar 1 in leap year = 1 month
-            date_str = "2024-02-01T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
-            assert result == "1 month"
+        assert result == "5 days"
 
     def test_plural_vs_singular(self):
         """Test that plural/singular forms are correct."""
+        # Test 2 of each unit (should be plural)
+        date_str = "2022-10-24T12:00:00Z"
+        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        result = calculate_age(date_str, date_format, FROZEN_NOW)
+
+        # Should use plural forms
+        assert "years" in result
+        assert "months" in result
+        assert "weeks" in result
+
+
+class TestFormatAge:
+    """Tests for the format_age function."""
+
+    def test_supplied_reference_time(self):
+        """Test the age is measured from the supplied reference time."""
+        then = dt.datetime(2025, 12, 13, 12, tzinfo=dt.UTC)
+        now = dt.datetime(2026, 2, 7, 12, tzinfo=dt.UTC)
+
+        assert format_age(then, now) == "1 month and 3 weeks"
+
+    def test_defaults_to_current_time(self):
+        """Test the current time is used when no reference time is given."""
+        with freeze_time(FROZEN_NOW):
+            result = format_age(dt.datetime(2026, 2, 2, 12, tzinfo=dt.UTC))
+
+        assert result == "5 days"
+
+
+class TestCurrentDateString:
+    """Tests for the current_date_string function."""
+
+    def test_default_format(self):
+        """Test the current time is formatted with the default date format."""
+        with freeze_time(FROZEN_NOW):
+            assert current_date_string() == "2026/02/07 12:00:00 UTC"
+
+    def test_custom_format(self):
+        """Test the current time is formatted with a custom date format."""
+        with freeze_time(FROZEN_NOW):
+            assert current_date_string("%Y-%m-%d") == "2026-02-07"
+
+    def test_value_updates_when_time_moves_on(self):
+        """Test the value follows the current time."""
+        with freeze_time(FROZEN_NOW) as frozen_time:
+            first = current_date_string()
+            frozen_time.tick(dt.timedelta(seconds=1))
+            second = current_date_string()
+
+        assert first == "2026/02/07 12:00:00 UTC"
+        assert second == "2026/02/07 12:00:01 UTC"
+
+
+class TestWriteTextAtomic:
+    """Tests for the write_text_atomic function."""
+
+    def test_writes_new_file(self, tmp_path):
+        """Test writing a file that does not exist yet."""
+        filepath = tmp_path / "page.html"
+        write_text_atomic(filepath, "<p>hello</p>")
+
+        assert filepath.read_text(encoding="utf8") == "<p>hello</p>"
+
+    def test_replaces_existing_file(self, tmp_path):
+        """Test an existing file is replaced and no temporary file is left."""
+        filepath = tmp_path / "page.html"
+        filepath.write_text("old")
+
+        write_text_atomic(str(filepath), "new")
+
+        assert filepath.read_text(encoding="utf8") == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["page.html"]
+
+
+class TestGetTemplate:
+    """Tests for the get_template function."""
+
+    def test_environment_shared_per_directory(self, tmp_path):
+        """Templates from one directory share a single Jinja environment."""
+        (tmp_path / "a.jinja").write_text("a")
+        (tmp_path / "b.jinja").write_text("b")
+
+        first = get_template(str(tmp_path), "a.jinja")
+        second = get_template(str(tmp_path), "b.jinja")
+
+        assert first.environment is second.environment
+        assert get_template(str(tmp_path), "a.jinja") is first
+
+    def test_edited_template_reloaded(self, tmp_path):
+        """A template changed on disk is reloaded rather than served stale."""
+        template_path = tmp_path / "page.jinja"
+        template_path.write_text("old")
+        get_template(str(tmp_path), "page.jinja")
+
+        template_path.write_text("new")
+        os.utime(template_path, (0, 2_000_000_000))
 
-        with freeze_time("2026-02-07 12:00:00+00:00"):
-            # Test 2 of each unit (should be plural)
-            date_str = "2022-10-24T12:00:00Z"
-            date_format = "%Y-%m-%dT%H:%M:%SZ"
-            result = calculate_age(date_str, date_format)
+        assert get_template(str(tmp_path), "page.jinja").render() == "new"
 
-            # Should use plural forms
-            assert "years" in result
-            assert "months" in result
-            assert "weeks" in result
+    def test_missing_template_raises(self, tmp_path):
+        """A missing template raises an AttributeError."""
+        with pytest.raises(AttributeError, match="not found"):
+            get_template(str(tmp_path), "missing.jinja")
@@ -0,0 +1,97 @@
+"""Tests for ipper.common.wiki module."""
+
+import pytest
+
+from ipper.common.wiki import APACHE_CONFLUENCE_BASE_URL, child_page_generator
+
+CHILDREN_URL = APACHE_CONFLUENCE_BASE_URL + "/rest/api/content/1/child"
+PAGE_URL = APACHE_CONFLUENCE_BASE_URL + "/rest/api/content/1/child/page"
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests.Response holding a JSON body."""
+
+    def __init__(self, body: dict):
+        self.body = body
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return self.body
+
+
+class FakeConfluence:
+    """A session serving child pages, returning at most max_limit per request."""
+
+    def __init__(self, child_count: int, max_limit: int):
+        self.children = [{"title": f"Page {number}"} for number in range(child_count)]
+        self.max_limit = max_limit
+        self.starts: list[int] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def get(self, url: str, params: dict | None = None, timeout: int = 30):
+        if url == CHILDREN_URL:
+            return FakeResponse(
+                {"_expandable": {"page": "/rest/api/content/1/child/page"}}
+            )
+
+        assert url == PAGE_URL
+        start = int(params["start"])
+        limit = min(int(params["limit"]), self.max_limit)
+        self.starts.append(start)
+        links = {}
+        if start + limit < len(self.children):
+            links["next"] = f"/rest/api/content/1/child/page?start={start + limit}"
+
+        return FakeResponse(
+            {
+                "results": self.children[start : start + limit],
+                "start": start,
+                "limit": limit,
+                "_links": links,
+            }
+        )
+
+
+class TestChildPageGenerator:
+    """Tests for child_page_generator()."""
+
+    WIKI_PAGE_INFO = {"_expandable": {"children": "/rest/api/content/1/child"}}
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_all_children_yielded_in_order(self, mocker, workers):
+        """Every child page is yielded once and in order."""
+        confluence = FakeConfluence(child_count=10, max_limit=100)
+        mocker.patch("ipper.common.wiki.requests.Session", return_value=confluence)
+
+        result = list(child_page_generator(self.WIKI_PAGE_INFO, 4, 30, workers))
+
+        assert result == confluence.children
+
+    def test_server_page_size_used_for_offsets(self, mocker):
+        """Offsets follow the page size the server used, not the one requested."""
+        confluence = FakeConfluence(child_count=10, max_limit=3)
+        mocker.patch("ipper.common.wiki.requests.Session", return_value=confluence)
+
+        result = list(child_page_generator(self.WIKI_PAGE_INFO, 4, 30, 2))
+
+        assert result == confluence.children
+        # The last wave of requests may also ask for a page past the end
+        assert sorted(confluence.starts)[:4] == [0, 3, 6, 9]
+        assert all(start % 3 == 0 for start in confluence.starts)
+
+    def test_single_page(self, mocker):
+        """A single page of children is fetched with one page request."""
+        confluence = FakeConfluence(child_count=2, max_limit=100)
+        mocker.patch("ipper.common.wiki.requests.Session", return_value=confluence)
+
+        result = list(child_page_generator(self.WIKI_PAGE_INFO, 4, 30))
+
+        assert result == confluence.children
+        assert confluence.starts == [0]
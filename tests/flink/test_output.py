@@ -1,4 +1,4 @@
-"""Tests for ipper.flink.output.create_vote_dict cross-type deduplication."""
+"""Tests for ipper.flink.output."""
 
 import pandas as pd
 
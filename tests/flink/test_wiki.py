@@ -0,0 +1,246 @@
+"""Tests for ipper.flink.wiki summary table parsing."""
+
+from lxml import html
+
+from ipper.common.constants import NOT_SET_STR, UNKNOWN_STR, IPState
+from ipper.common.jira import JiraStatus
+from ipper.flink.wiki import (
+    DISCUSSION_THREAD_KEY,
+    JIRA_LINK_KEY,
+    RELEASE_COMPONENT_KEY,
+    RELEASE_VERSION_KEY,
+    VOTE_THREAD_KEY,
+    _determine_state,
+    _enrich_flip_info,
+    _find_Jira_key_and_link,
+    _get_release_version,
+    get_flip_information,
+)
+
+SUMMARY_TABLE_HTML = """
+<p>Some introduction text.</p>
+<div class="table-wrap">
+<table class="confluenceTable"><tbody>
+<tr><th>Discussion thread</th>
+<td><a href="https://lists.apache.org/thread/abc">thread</a></td></tr>
+<tr><th>Vote thread</th>
+<td>here (&lt;- link to the vote thread)</td></tr>
+<tr><th>Release</th><td>1.19</td></tr>
+</tbody></table>
+</div>
+<table><tbody><tr><th>Vote thread</th>
+<td><a href="https://lists.apache.org/thread/other">other</a></td></tr></tbody></table>
+"""
+
+
+class TestEnrichFlipInfo:
+    """Tests for _enrich_flip_info()."""
+
+    def test_summary_table_rows_are_parsed(self):
+        """Discussion, vote and release rows of the first table are extracted."""
+        flip_dict: dict = {}
+        _enrich_flip_info(1, SUMMARY_TABLE_HTML, flip_dict)
+
+        assert flip_dict[DISCUSSION_THREAD_KEY] == "https://lists.apache.org/thread/abc"
+        assert flip_dict[VOTE_THREAD_KEY] == NOT_SET_STR
+        assert flip_dict[RELEASE_COMPONENT_KEY] == "Flink"
+        assert flip_dict[RELEASE_VERSION_KEY] == "1.19"
+
+    def test_discussion_only_is_under_discussion(self):
+        """A FLIP with only a discussion thread is under discussion."""
+        body = (
+            "<table><tr><th>Discussion thread</th>"
+            '<td><a href="https://lists.apache.org/thread/abc">t</a></td></tr></table>'
+        )
+        flip_dict: dict = {}
+        _enrich_flip_info(2, body, flip_dict)
+
+        assert flip_dict["state"] == IPState.UNDER_DISCUSSION
+
+    def test_first_matching_header_wins(self):
+        """A header matching several row types is only used for the first."""
+        body = (
+            "<table><tr><th>Discussion / vote thread</th>"
+            '<td><a href="https://lists.apache.org/thread/abc">t</a></td></tr></table>'
+        )
+        flip_dict: dict = {}
+        _enrich_flip_info(4, body, flip_dict)
+
+        assert flip_dict[DISCUSSION_THREAD_KEY] == "https://lists.apache.org/thread/abc"
+        assert flip_dict[VOTE_THREAD_KEY] == UNKNOWN_STR
+
+    def test_no_table_leaves_defaults(self):
+        """A FLIP without a summary table keeps the unknown defaults."""
+        flip_dict: dict = {}
+        _enrich_flip_info(3, "<p>No table here</p>", flip_dict)
+
+        assert flip_dict[DISCUSSION_THREAD_KEY] == UNKNOWN_STR
+        assert flip_dict[VOTE_THREAD_KEY] == UNKNOWN_STR
+        assert flip_dict["state"] == IPState.UNKNOWN
+
+
+class TestFindJiraKeyAndLink:
+    """Tests for _find_Jira_key_and_link()."""
+
+    JIRA_SPAN = (
+        '<span class="jira-issue conf-macro output-block" data-jira-key="FLINK-9">'
+        '<a href="https://issues.apache.org/jira/browse/FLINK-9">FLINK-9</a></span>'
+    )
+
+    def test_key_and_link_extracted(self):
+        """The key and link come from the JIRA macro span."""
+        cell = html.fragment_fromstring(
+            f'<td><div class="content-wrapper"><p>{self.JIRA_SPAN}</p></div></td>'
+        )
+
+        assert _find_Jira_key_and_link(cell) == (
+            "FLINK-9",
+            "https://issues.apache.org/jira/browse/FLINK-9",
+        )
+
+    def test_only_first_content_wrapper_used(self):
+        """A JIRA macro outside the first content wrapper is ignored."""
+        cell = html.fragment_fromstring(
+            '<td><div class="content-wrapper"><p>None yet</p></div>'
+            f'<div class="content-wrapper">{self.JIRA_SPAN}</div></td>'
+        )
+
+        assert _find_Jira_key_and_link(cell) == (None, None)
+
+
+class TestGetReleaseVersion:
+    """Tests for _get_release_version()."""
+
+    def test_single_version(self):
+        """A single version defaults to the Flink component."""
+        assert _get_release_version(" 1.19 ") == ("Flink", "1.19")
+
+    def test_component_prefix(self):
+        """A prefix before the version is used as the component."""
+        assert _get_release_version("kubernetes-operator-1.7.0") == (
+            "kubernetes-operator",
+            "1.7.0",
+        )
+
+    def test_multiple_versions_sorted_and_joined(self):
+        """Several versions are sorted and joined."""
+        assert _get_release_version("2.0, 1.20 and 1.19.1") == (
+            "Flink",
+            "1.19.1, 1.20, 2.0",
+        )
+
+    def test_no_version(self):
+        """Text without a version number is not set."""
+        assert _get_release_version("TBD") == (None, NOT_SET_STR)
+
+
+class TestDetermineState:
+    """Tests for _determine_state() with pre-fetched JIRA statuses."""
+
+    JIRA_LINK = "https://issues.apache.org/jira/browse/FLINK-1234"
+
+    def test_uses_prefetched_status(self, mocker):
+        """A pre-fetched JIRA status is used without a further lookup."""
+        single_lookup = mocker.patch("ipper.flink.wiki.get_apache_jira_status")
+        flip_dict = {JIRA_LINK_KEY: self.JIRA_LINK}
+
+        result = _determine_state(flip_dict, {"FLINK-1234": JiraStatus.RESOLVED})
+
+        assert result == IPState.COMPLETED
+        single_lookup.assert_not_called()
+
+    def test_falls_back_to_single_lookup(self, mocker):
+        """A JIRA missing from the pre-fetched statuses is looked up directly."""
+        single_lookup = mocker.patch(
+            "ipper.flink.wiki.get_apache_jira_status",
+            return_value=JiraStatus.IN_PROGRESS,
+        )
+        flip_dict = {JIRA_LINK_KEY: self.JIRA_LINK}
+
+        result = _determine_state(flip_dict, {})
+
+        assert result == IPState.IN_PROGRESS
+        single_lookup.assert_called_once_with("FLINK-1234")
+
+
+def _make_child_page(flip_id: int, body_html: str) -> dict:
+    """Build a minimal Confluence child page dict matching the API shape."""
+    return {
+        "title": f"FLIP-{flip_id}: Test Proposal",
+        "_links": {
+            "webui": f"/wiki/flip-{flip_id}",
+            "self": f"https://cwiki.apache.org/rest/api/content/{flip_id}",
+        },
+        "history": {
+            "createdDate": "2025-01-01T00:00:00.000Z",
+            "createdBy": {"displayName": "Author"},
+            "lastUpdated": {
+                "when": "2025-06-01T00:00:00.000Z",
+                "by": {"displayName": "Editor"},
+            },
+        },
+        "body": {"view": {"value": body_html}},
+    }
+
+
+class TestGetFlipInformation:
+    """Tests for get_flip_information()."""
+
+    def test_all_flips_processed_with_bulk_jira_lookup(self, mocker):
+        """Every FLIP page is parsed and JIRA statuses are fetched in one call."""
+        jira_body = (
+            "<table><tr><th>JIRA</th><td>"
+            '<div class="content-wrapper">'
+            '<span class="jira-issue conf-macro output-block" '
+            'data-jira-key="FLINK-1"><a href="https://issues.apache.org/jira/'
+            'browse/FLINK-1">FLINK-1</a></span></div></td></tr></table>'
+        )
+        children = [
+            _make_child_page(1, jira_body),
+            _make_child_page(2, "<p>No table</p>"),
+            {"title": "Not a proposal page"},
+        ]
+        mocker.patch(
+            "ipper.flink.wiki.child_page_generator", return_value=iter(children)
+        )
+        bulk_lookup = mocker.patch(
+            "ipper.flink.wiki.get_apache_jira_statuses",
+            return_value={"FLINK-1": JiraStatus.OPEN},
+        )
+
+        result = get_flip_information({"id": "123"})
+
+        assert list(result) == [1, 2]
+        assert result[1]["state"] == IPState.IN_PROGRESS
+        assert result[2]["state"] == IPState.UNKNOWN
+        bulk_lookup.assert_called_once_with(["FLINK-1"])
+
+    def test_cached_flip_outside_refresh_window_skipped(self, mocker):
+        """A cached FLIP created before the refresh window is not re-processed."""
+        cached = {"title": "cached", "created_on": "2020-01-01T00:00:00.000Z"}
+        mocker.patch(
+            "ipper.flink.wiki.child_page_generator",
+            return_value=iter([_make_child_page(7, "<p>Updated</p>")]),
+        )
+        mocker.patch("ipper.flink.wiki.get_apache_jira_statuses", return_value={})
+
+        result = get_flip_information({"id": "123"}, existing_cache={7: cached})
+
+        assert result[7] is cached
+
+    def test_cached_flip_in_terminal_state_skipped(self, mocker):
+        """A recently created cached FLIP that is completed is not re-processed."""
+        cached = {
+            "title": "cached",
+            "created_on": "2099-01-01T00:00:00.000Z",
+            "state": "completed",
+        }
+        mocker.patch(
+            "ipper.flink.wiki.child_page_generator",
+            return_value=iter([_make_child_page(8, "<p>Updated</p>")]),
+        )
+        mocker.patch("ipper.flink.wiki.get_apache_jira_statuses", return_value={})
+
+        result = get_flip_information({"id": "123"}, existing_cache={8: cached})
+
+        assert result[8] is cached
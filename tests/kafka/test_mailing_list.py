@@ -0,0 +1,118 @@
+"""Tests for ipper.kafka.mailing_list cache update logic."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ipper.kafka.mailing_list import (
+    KIP_MENTION_COLUMNS,
+    KIPMentionType,
+    kmt_from_str,
+    update_kip_mentions_cache,
+)
+
+
+def _make_mentions(rows: list[dict]) -> pd.DataFrame:
+    """Helper to build a mentions DataFrame matching the cache schema."""
+    df = pd.DataFrame(rows, columns=KIP_MENTION_COLUMNS)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    return df
+
+
+def _mention(kip: int, message_id: int, month: int, vote: str | None = None) -> dict:
+    return {
+        "kip": kip,
+        "mention_type": "vote" if vote else "subject",
+        "message_id": message_id,
+        "mbox_year": 2025,
+        "mbox_month": month,
+        "timestamp": f"2025-{month:02d}-01 10:00:{message_id:02d}",
+        "from": "Alice",
+        "vote": vote,
+    }
+
+
+class TestUpdateKipMentionsCache:
+    """Tests for update_kip_mentions_cache()."""
+
+    @pytest.fixture(autouse=True)
+    def _no_committer_index(self, mocker):
+        mocker.patch("ipper.kafka.mailing_list.get_committer_index")
+
+    def test_new_mentions_appended_to_existing(self, tmp_path, mocker):
+        """Mentions from each new mbox file are added to the existing cache."""
+        output_file = tmp_path / "kip_mentions.csv"
+        _make_mentions([_mention(1, 1, 1)]).to_csv(output_file, index=False)
+
+        file_mentions = {
+            "2025-02.mbox": _make_mentions([_mention(2, 1, 2)]),
+            "2025-03.mbox": _make_mentions([_mention(3, 1, 3, "+1")]),
+        }
+        mocker.patch(
+            "ipper.kafka.mailing_list.process_mbox_archive",
+            side_effect=lambda path, committer_index: file_mentions[path.name],
+        )
+
+        result = update_kip_mentions_cache(
+            [Path("2025-02.mbox"), Path("2025-03.mbox")],
+            output_file,
+            tmp_path,
+            max_workers=1,
+        )
+
+        assert sorted(result["kip"].tolist()) == [1, 2, 3]
+        assert len(pd.read_csv(output_file)) == 3
+
+    def test_failed_file_is_skipped(self, tmp_path, mocker):
+        """A file that fails to process does not stop the others being added."""
+        output_file = tmp_path / "kip_mentions.csv"
+
+        def process(path: Path, committer_index) -> pd.DataFrame:
+            if path.name == "bad.mbox":
+                raise ValueError("corrupt mbox")
+            return _make_mentions([_mention(5, 1, 5)])
+
+        mocker.patch(
+            "ipper.kafka.mailing_list.process_mbox_archive", side_effect=process
+        )
+
+        result = update_kip_mentions_cache(
+            [Path("bad.mbox"), Path("2025-05.mbox")],
+            output_file,
+            tmp_path,
+            max_workers=1,
+        )
+
+        assert result["kip"].tolist() == [5]
+
+    def test_reprocessed_mentions_are_not_duplicated(self, tmp_path, mocker):
+        """Re-processing a month already in the cache does not duplicate rows."""
+        output_file = tmp_path / "kip_mentions.csv"
+        existing = _make_mentions([_mention(1, 1, 1), _mention(1, 2, 1, "+1")])
+        existing.to_csv(output_file, index=False)
+
+        mocker.patch(
+            "ipper.kafka.mailing_list.process_mbox_archive",
+            return_value=_make_mentions([_mention(1, 1, 1), _mention(1, 2, 1, "+1")]),
+        )
+
+        result = update_kip_mentions_cache(
+            [Path("2025-01.mbox")], output_file, tmp_path
+        )
+
+        assert len(result) == 2
+
+
+class TestKmtFromStr:
+    """Tests for kmt_from_str()."""
+
+    @pytest.mark.parametrize("mention_type", list(KIPMentionType))
+    def test_valid_mention_types(self, mention_type):
+        """Each mention type value maps back to its enum member."""
+        assert kmt_from_str(mention_type.value) is mention_type
+
+    def test_invalid_mention_type_raises(self):
+        """An unknown mention type raises a ValueError."""
+        with pytest.raises(ValueError, match="not a valid KIPMentionType"):
+            kmt_from_str("thread")
@@ -1,8 +1,12 @@
-"""Tests for ipper.kafka.output.create_vote_dict cross-type deduplication."""
+"""Tests for ipper.kafka.output."""
 
 import pandas as pd
 
-from ipper.kafka.output import create_vote_dict
+from ipper.kafka.output import (
+    clean_description,
+    create_vote_dict,
+    enrich_kip_wiki_info_with_votes,
+)
 
 
 def _make_mentions(rows: list[dict]) -> pd.DataFrame:
@@ -151,3 +155,62 @@ class TestCreateVoteDictCrossTypeDedup:
 
         names = [v["name"] for v in result[5]["+1"]]
         assert names == ["Bob", "Charlie", "Alice"]
+
+    def test_tied_voters_keep_first_vote_order(self):
+        """Voters whose latest votes are at the same time stay in first vote order."""
+        mentions = _make_mentions(
+            [
+                {
+                    "kip": 6,
+                    "from": "Bob",
+                    "vote": "0",
+                    "timestamp": "2025-01-01 09:00",
+                },
+                {
+                    "kip": 6,
+                    "from": "Alice",
+                    "vote": "+1",
+                    "timestamp": "2025-01-02 10:00",
+                },
+                {
+                    "kip": 6,
+                    "from": '"Bob"',
+                    "vote": "+1",
+                    "timestamp": "2025-01-02 10:00",
+                },
+            ]
+        )
+        result = create_vote_dict(mentions)
+
+        names = [v["name"] for v in result[6]["+1"]]
+        assert names == ["Bob", "Alice"]
+        assert result[6]["0"] == []
+
+
+class TestCleanDescription:
+    """Tests for clean_description()."""
+
+    def test_kip_prefix_removed(self):
+        """The leading KIP number and separator are stripped."""
+        assert clean_description("KIP-123: Add a feature") == "Add a feature"
+
+    def test_kip_not_at_start_kept(self):
+        """A KIP reference later in the title is left alone."""
+        assert clean_description("Follow up to KIP-123") == "Follow up to KIP-123"
+
+
+class TestEnrichKipWikiInfoWithVotes:
+    """Tests for enrich_kip_wiki_info_with_votes()."""
+
+    def test_supplied_vote_dict_is_used(self, mocker):
+        """A pre-computed vote dictionary is used without re-aggregating votes."""
+        aggregate = mocker.patch("ipper.kafka.output.create_vote_dict")
+        votes = {"+1": [{"name": "Alice", "timestamp": "t"}], "0": [], "-1": []}
+
+        result = enrich_kip_wiki_info_with_votes(
+            {1: {"title": "One"}, 2: {"title": "Two"}}, _make_mentions([]), {1: votes}
+        )
+
+        assert result[1]["+1"] == votes["+1"]
+        assert result[2]["+1"] == []
+        aggregate.assert_not_called()
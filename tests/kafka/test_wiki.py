@@ -7,11 +7,14 @@ import pytest
 from ipper.common.constants import NOT_SET_STR, IPState
 from ipper.kafka.wiki import (
     ACCEPTED_TERMS,
+    KIP_TEMPLATE_DEFAULT_DISCUSSION_URL,
+    KIP_TEMPLATE_DEFAULT_JIRA_URL,
     NOT_ACCEPTED_TERMS,
     UNDER_DISCUSSION_TERMS,
     enrich_kip_info,
     get_current_state,
     get_kip_information,
+    is_template_default_url,
 )
 
 # The exact template placeholder text from the KIP wiki template
@@ -98,6 +101,25 @@ class TestGetCurrentState:
         assert get_current_state("") is None
 
 
+class TestIsTemplateDefaultUrl:
+    """Tests for is_template_default_url()."""
+
+    @pytest.mark.parametrize(
+        ("url", "field_type", "expected"),
+        [
+            (KIP_TEMPLATE_DEFAULT_JIRA_URL, "jira", True),
+            ([KIP_TEMPLATE_DEFAULT_DISCUSSION_URL], "discussion", True),
+            (KIP_TEMPLATE_DEFAULT_JIRA_URL, "discussion", False),
+            ("https://issues.apache.org/jira/browse/KAFKA-17", "jira", False),
+            (KIP_TEMPLATE_DEFAULT_JIRA_URL, "vote", False),
+            (None, "jira", False),
+        ],
+    )
+    def test_template_defaults(self, url, field_type, expected):
+        """Only the default URL for the given field type is a template default."""
+        assert is_template_default_url(url, field_type) is expected
+
+
 class TestEnrichKipInfo:
     """Integration tests for enrich_kip_info()."""
 
@@ -141,6 +163,23 @@ class TestEnrichKipInfo:
         assert kip_dict["discussion_thread"] == NOT_SET_STR
         assert kip_dict["vote_thread"] == NOT_SET_STR
 
+    def test_header_links_extracted_and_later_paragraphs_ignored(self):
+        """The header paragraphs are parsed and later mentions do not override them."""
+        body = (
+            "<p>Current state: Accepted</p>"
+            '<p>Discussion thread: <a href="https://lists.apache.org/thread/d">d</a></p>'
+            '<p>Vote thread: <a href="https://lists.apache.org/thread/v">v</a></p>'
+            '<p>JIRA: <a href="https://issues.apache.org/jira/browse/KAFKA-17">17</a></p>'
+            '<p>See the JIRA <a href="https://example.com/other">here</a></p>'
+        )
+        kip_dict: dict = {}
+        enrich_kip_info(body, kip_dict)
+
+        assert kip_dict["state"] == IPState.ACCEPTED
+        assert kip_dict["discussion_thread"] == "https://lists.apache.org/thread/d"
+        assert kip_dict["vote_thread"] == "https://lists.apache.org/thread/v"
+        assert kip_dict["jira"] == "https://issues.apache.org/jira/browse/KAFKA-17"
+
 
 class TestGetKipInformationCacheUpdate:
     """Tests for cache update logic in get_kip_information()."""
@@ -267,3 +306,31 @@ class TestGetKipInformationCacheUpdate:
 
         assert result[400]["state"] == IPState.ACCEPTED
         assert result[400]["last_modified_on"] == "2025-07-01T00:00:00.000Z"
+
+    def test_cached_information_does_not_fetch_main_page(self, tmp_path, mocker):
+        """Without an update, the cache is used without fetching the main page."""
+        cache_file = tmp_path / "cache" / "kip_cache.json"
+        self._write_cache(cache_file, {"500": {"kip_id": 500}})
+        main_page = mocker.patch("ipper.kafka.wiki.get_kip_main_page_info")
+
+        result = get_kip_information(cache_filepath=str(cache_file))
+
+        assert result == {500: {"kip_id": 500}}
+        main_page.assert_not_called()
+
+    def test_main_page_fetched_when_downloading(self, tmp_path, mocker):
+        """The main page info is fetched when the child pages are downloaded."""
+        cache_file = tmp_path / "cache" / "kip_cache.json"
+        main_page = mocker.patch(
+            "ipper.kafka.wiki.get_kip_main_page_info", return_value={"id": "123"}
+        )
+        children = mocker.patch(
+            "ipper.kafka.wiki.child_page_generator",
+            return_value=iter([_make_child_page(600)]),
+        )
+
+        result = get_kip_information(cache_filepath=str(cache_file))
+
+        assert 600 in result
+        main_page.assert_called_once()
+        assert children.call_args.args[0] == {"id": "123"}